@@ -25,7 +25,7 @@ import streamlit as st
 import pandas as pd
 
 # Core imports
-from utils.predict import predict_emotions
+from utils.predict import predict_emotions_batch, predict_dominant_emotion
 from utils.labels import EMOTIONS, EMOJI_MAP
 
 # Services
@@ -468,19 +468,26 @@ init_session_state()
 # HELPER FUNCTIONS
 # ============================================================
 
+# Markdown patterns used by format_markdown_to_html
+MD_BOLD_PATTERN = re.compile(r'\*\*(.+?)\*\*')
+MD_ITALIC_PATTERN = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+MD_NUMBERED_PATTERN = re.compile(r'^(\d+)\.\s+', flags=re.MULTILINE)
+MD_BULLET_PATTERN = re.compile(r'^-\s+', flags=re.MULTILINE)
+
+
 def format_markdown_to_html(text: str) -> str:
     """Convert markdown to HTML for rendering"""
     if not text:
         return text
     
     # Bold
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = MD_BOLD_PATTERN.sub(r'<strong>\1</strong>', text)
     # Italic
-    text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'<em>\1</em>', text)
+    text = MD_ITALIC_PATTERN.sub(r'<em>\1</em>', text)
     # Numbered lists
-    text = re.sub(r'^(\d+)\.\s+', r'<strong>\1.</strong> ', text, flags=re.MULTILINE)
+    text = MD_NUMBERED_PATTERN.sub(r'<strong>\1.</strong> ', text)
     # Bullet points
-    text = re.sub(r'^-\s+', r'• ', text, flags=re.MULTILINE)
+    text = MD_BULLET_PATTERN.sub(r'• ', text)
     # Line breaks
     text = text.replace('\n', '<br>')
     
@@ -490,10 +497,7 @@ def format_markdown_to_html(text: str) -> str:
 def get_dominant_emotion(text: str) -> Tuple[str, float]:
     """Get dominant emotion from text"""
     try:
-        emotions, probs = predict_emotions(text, threshold=0.1)
-        if probs:
-            dominant = max(probs.items(), key=lambda x: x[1])
-            return dominant[0], dominant[1]
+        return predict_dominant_emotion(text)
     except:
         pass
     return "neutral", 0.5
@@ -1270,15 +1274,16 @@ def run_business_analysis(comments: List[str]):
         all_emotions = {}
         emotion_counts = {e: 0 for e in EMOTIONS}
         
-        for comment in comments:
-            try:
-                emotions, probs = predict_emotions(comment, threshold=0.3)
-                for emotion, prob in probs.items():
-                    all_emotions[emotion] = all_emotions.get(emotion, 0) + prob
-                    if prob >= 0.3:
-                        emotion_counts[emotion] += 1
-            except:
-                pass
+        try:
+            predictions = predict_emotions_batch(comments, threshold=0.3)
+        except:
+            predictions = []
+        
+        for emotions, probs in predictions:
+            for emotion, prob in probs.items():
+                all_emotions[emotion] = all_emotions.get(emotion, 0) + prob
+                if prob >= 0.3:
+                    emotion_counts[emotion] += 1
         
         # Average emotions
         n = len(comments)
@@ -2,7 +2,7 @@
 Streamlit Component for Smart Emotional Summary Display
 """
 import streamlit as st
-from utils.labels import EMOJI_MAP
+from utils.labels import EMOJI_MAP, POSITIVE_EMOTIONS, NEGATIVE_EMOTIONS
 
 
 def render_emotional_summary(result: dict):
@@ -27,15 +27,11 @@ def render_emotional_summary(result: dict):
     confidence = result.get("confidence", 0.0)
     
     # Categorize emotions for business
-    positive_emotions = ["joy", "love", "gratitude", "admiration", "excitement", "optimism", "pride", "relief"]
-    negative_emotions = ["anger", "sadness", "fear", "disappointment", "disgust", "annoyance", "disapproval", "embarrassment"]
-    neutral_emotions = ["curiosity", "surprise", "confusion", "realization", "neutral"]
-    
-    if dominant_emotion in positive_emotions:
+    if dominant_emotion in POSITIVE_EMOTIONS:
         sentiment_category = "Positive"
         sentiment_color = "🟢"
         brand_health = "Healthy"
-    elif dominant_emotion in negative_emotions:
+    elif dominant_emotion in NEGATIVE_EMOTIONS:
         sentiment_category = "Negative"
         sentiment_color = "🔴"
         brand_health = "Needs Attention"
@@ -91,10 +87,10 @@ def render_emotional_summary(result: dict):
                 emotion_emoji = EMOJI_MAP.get(emotion, "🎭")
                 
                 # Add context for business
-                if emotion in positive_emotions:
+                if emotion in POSITIVE_EMOTIONS:
                     delta_indicator = "Positive signal"
                     delta_color = "normal"
-                elif emotion in negative_emotions:
+                elif emotion in NEGATIVE_EMOTIONS:
                     delta_indicator = "Action needed"
                     delta_color = "inverse"
                 else:
@@ -116,9 +112,9 @@ def render_emotional_summary(result: dict):
             }
             
             for e, _ in sorted_emotions:
-                if e in positive_emotions:
+                if e in POSITIVE_EMOTIONS:
                     emotion_df_data["Category"].append("🟢 Positive")
-                elif e in negative_emotions:
+                elif e in NEGATIVE_EMOTIONS:
                     emotion_df_data["Category"].append("🔴 Negative")
                 else:
                     emotion_df_data["Category"].append("🟡 Neutral")
@@ -159,9 +155,9 @@ def render_emotional_summary(result: dict):
     suggested_action = result.get("suggested_action", "No action suggested")
     
     # Style the action based on emotion category
-    if dominant_emotion in negative_emotions:
+    if dominant_emotion in NEGATIVE_EMOTIONS:
         st.error(f"**Priority Action Required:**\n\n{suggested_action}")
-    elif dominant_emotion in positive_emotions:
+    elif dominant_emotion in POSITIVE_EMOTIONS:
         st.success(f"**Opportunity to Leverage:**\n\n{suggested_action}")
     else:
         st.info(f"**Strategic Recommendation:**\n\n{suggested_action}")
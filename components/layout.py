@@ -2,6 +2,7 @@
 EmoSense AI - Global Design System
 Glassmorphism, gradients, and emotional dark-mode optimized UI
 """
+import functools
 import streamlit as st
 from pathlib import Path
 from typing import Callable
@@ -17,18 +18,23 @@ def set_page_config():
     )
 
 
-def inject_global_styles():
-    """Inject premium global CSS styles"""
+@st.cache_resource
+def load_global_css() -> str:
+    """Read styles/main.css once per process and return it as a <style> block"""
     try:
         css = Path("styles/main.css").read_text(encoding="utf-8")
     except Exception:
         css = ""
-    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+    return f"<style>{css}</style>"
+
+
+def inject_global_styles():
+    """Inject premium global CSS styles"""
+    st.markdown(load_global_css(), unsafe_allow_html=True)
 
 
 def page_container():
-    """Return a centered container with max-width"""
-    inject_global_styles()
+    """Return a centered container with max-width (call inject_global_styles() first)"""
     return st.container()
 
 def render_header():
@@ -117,14 +123,24 @@ def render_header():
     """, unsafe_allow_html=True)
 
 
+def minify_html(html: str) -> str:
+    """Strip indentation and blank lines from an HTML snippet (newlines kept as whitespace)"""
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def gradient_hero_html(title: str, subtitle: str) -> str:
+    """Return gradient hero section HTML (unindented, safe to concatenate)"""
+    return (
+        f'<div class="gradient-hero fade-in">'
+        f'<h1 class="hero-title">{title}</h1>'
+        f'<p class="hero-subtitle">{subtitle}</p>'
+        f'</div>'
+    )
+
+
 def gradient_hero(title: str, subtitle: str):
     """Render gradient hero section"""
-    st.markdown(f"""
-    <div class="gradient-hero fade-in">
-        <h1 class="hero-title">{title}</h1>
-        <p class="hero-subtitle">{subtitle}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(gradient_hero_html(title, subtitle))
 
 
 def page_header(title: str, subtitle: str, primary_cta: tuple = None, secondary_cta: tuple = None):
@@ -160,24 +176,55 @@ def card(content_html: str):
     st.markdown(f'<div class="premium-card fade-in">{content_html}</div>', unsafe_allow_html=True)
 
 
+@functools.lru_cache(maxsize=64)
+def section_card_html(title: str, icon: str, margin_top: str = None) -> str:
+    """Return section card header HTML (single line, safe to embed in markdown)"""
+    style = f' style="margin-top: var(--spacer-{margin_top});"' if margin_top else ""
+    return (
+        f'<div class="section-card fade-in"{style}>'
+        f'<div class="section-header">'
+        f'<span class="section-icon">{icon}</span>'
+        f'<h2 class="section-title">{title}</h2>'
+        f'</div>'
+        f'</div>'
+    )
+
+
 def section_card(title: str, icon: str, body_fn: Callable):
     """Render a glassmorphic section card with icon and title"""
-    st.markdown(f"""
-    <div class="section-card fade-in">
-        <div class="section-header">
-            <span class="section-icon">{icon}</span>
-            <h2 class="section-title">{title}</h2>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(section_card_html(title, icon), unsafe_allow_html=True)
     
     # Call the body function to render content
     body_fn()
 
 
+@st.fragment
+def collapsible_section(key: str, title: str, body: str):
+    """
+    Render a section whose plain-markdown body is only emitted while it is open.
+
+    Toggling reruns just this fragment instead of the whole page.
+    """
+    flag = f"section_open_{key}"
+    is_open = st.session_state.setdefault(flag, False)
+    
+    if st.button(f"{'▾' if is_open else '▸'} {title}", key=f"section_btn_{key}", use_container_width=True):
+        is_open = not is_open
+        st.session_state[flag] = is_open
+        st.rerun(scope="fragment")
+    
+    if is_open:
+        st.markdown(body)
+
+
+def spacer_html(size: str = "md") -> str:
+    """Return vertical spacing HTML"""
+    return f'<div class="spacer-{size}"></div>'
+
+
 def spacer(size: str = "md"):
     """Add vertical spacing"""
-    st.markdown(f'<div class="spacer-{size}"></div>', unsafe_allow_html=True)
+    st.html(spacer_html(size))
 
 
 def emotion_chip(emotion: str, score: float = None, emoji: str = ""):
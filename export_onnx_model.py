@@ -0,0 +1,37 @@
+"""
+Script to export the BERT emotion model to ONNX and quantize it to int8
+Run this once on the deployment host (or a machine with the same CPU family);
+utils/predict.py picks up models/emotion_bert_onnx_int8/ automatically
+Requires: pip install optimum[onnxruntime]
+"""
+from pathlib import Path
+
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+MODEL_ID = "Amarnoor/emotion-bert-emosense"
+
+
+def export_and_quantize():
+    """Export the HuggingFace model to ONNX, then apply dynamic int8 quantization"""
+    models_dir = Path(__file__).parent / "models"
+    onnx_dir = models_dir / "emotion_bert_onnx"
+    int8_dir = models_dir / "emotion_bert_onnx_int8"
+    
+    print(f"Exporting {MODEL_ID} to ONNX...")
+    ort_model = ORTModelForSequenceClassification.from_pretrained(MODEL_ID, export=True)
+    ort_model.save_pretrained(onnx_dir)
+    AutoTokenizer.from_pretrained(MODEL_ID).save_pretrained(onnx_dir)
+    print(f"  ✅ Saved FP32 model to {onnx_dir}")
+    
+    print("Quantizing to int8 (dynamic, VNNI)...")
+    quantizer = ORTQuantizer.from_pretrained(onnx_dir)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=int8_dir, quantization_config=qconfig)
+    print(f"  ✅ Saved int8 model to {int8_dir}")
+    
+    print("\n✅ Done! Restart the Streamlit app to use the ONNX model.")
+
+if __name__ == "__main__":
+    export_and_quantize()
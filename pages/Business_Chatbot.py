@@ -18,11 +18,14 @@ import os
 # Fix import path for Streamlit Cloud
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import re
+import time
+from collections import Counter
 import streamlit as st
 import pandas as pd
-import json
+import numpy as np
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 try:
     import plotly.graph_objects as go
@@ -43,16 +46,11 @@ from components.layout import (
 from components.footer import render_footer
 
 # Core services
-from utils.predict import predict_emotions
-from utils.labels import EMOTIONS, EMOJI_MAP
+from utils.predict import predict_comment_probs
+from utils.json_export import dumps_json
+from utils.labels import EMOTIONS, EMOTION_NAMES, EMOJI_MAP, EMOTION_DISPLAY, POSITIVE_EMOTIONS, NEGATIVE_EMOTIONS
 
-# Summarization
-try:
-    from services.summary_service_local import summarize_text_local, combine_emotion_and_summary
-    USE_LOCAL_SUMMARY = True
-except:
-    from services.summary_service import summarize_text, combine_emotion_and_summary
-    USE_LOCAL_SUMMARY = False
+# Summarization services are imported on first use (see load_summary_service)
 
 # RAG and LLM services
 try:
@@ -96,6 +94,101 @@ except Exception as e:
 # OpenAI for chat
 from openai import OpenAI
 
+# Emotions reported as weaknesses: the negative bucket plus confusion
+WEAKNESS_EMOTIONS = NEGATIVE_EMOTIONS | {"confusion"}
+
+# Business Buddy chat renders only this many recent messages by default
+CHAT_HISTORY_RENDER_LIMIT = 20
+
+# Business Buddy chat keeps at most this many messages in session state
+CHAT_HISTORY_MAX_MESSAGES = 50
+
+# CSV headers (case- and space-insensitive) preselected as the comment column
+COMMENT_COLUMN_NAMES = frozenset({"comment", "comments", "text", "message", "body", "content", "review", "feedback"})
+
+# Raw vs Refined comparison card styles, emitted once per chat render
+COMPARISON_CSS = """
+<style>
+.comparison-container {
+    display: flex;
+    gap: 1rem;
+    margin: 1rem 0;
+}
+.comparison-card {
+    flex: 1;
+    border-radius: 16px;
+    padding: 24px;
+    min-height: 300px;
+}
+.comparison-card.raw {
+    background: rgba(55, 65, 81, 0.3);
+    border: 1px solid rgba(107, 114, 128, 0.4);
+}
+.comparison-card.refined {
+    background: linear-gradient(135deg, rgba(138, 92, 246, 0.2), rgba(59, 130, 246, 0.15));
+    border: 2px solid rgba(138, 92, 246, 0.5);
+    box-shadow: 0 4px 20px rgba(138, 92, 246, 0.2);
+}
+.comparison-header {
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    margin-bottom: 1rem;
+    padding-bottom: 0.75rem;
+    border-bottom: 2px solid rgba(255,255,255,0.1);
+}
+.comparison-header.raw {
+    border-bottom-color: rgba(107, 114, 128, 0.4);
+}
+.comparison-header.refined {
+    border-bottom-color: rgba(138, 92, 246, 0.5);
+}
+.comparison-title {
+    font-size: 1.1rem;
+    font-weight: 600;
+    margin: 0;
+}
+.comparison-title.raw {
+    color: #9CA3AF;
+}
+.comparison-title.refined {
+    color: #A78BFA;
+}
+.comparison-badge {
+    padding: 0.25rem 0.75rem;
+    border-radius: 20px;
+    font-size: 0.7rem;
+    font-weight: 600;
+    text-transform: uppercase;
+}
+.comparison-badge.raw {
+    background: rgba(107, 114, 128, 0.3);
+    color: #9CA3AF;
+}
+.comparison-badge.refined {
+    background: rgba(138, 92, 246, 0.3);
+    color: #A78BFA;
+}
+.comparison-content {
+    line-height: 1.8;
+    font-size: 0.92rem;
+}
+.comparison-content.raw {
+    color: #D1D5DB;
+}
+.comparison-content.refined {
+    color: #F3F4F6;
+}
+.comparison-content strong {
+    color: #FFFFFF;
+    font-weight: 600;
+}
+.comparison-content.refined strong {
+    color: #C4B5FD;
+}
+</style>
+"""
+
 # Configure
 set_page_config()
 inject_global_styles()
@@ -130,6 +223,9 @@ def init_session_state():
         "analysis_sentiments": {},
         "analysis_complete": False,
         "crisis_alerts": [],
+        # Report JSON bytes and file name, built once per analysis
+        "report_json": None,
+        "report_file_name": "",
         # New: Persistent chat context
         "chat_context_built": False,
         "chat_system_prompt": "",
@@ -158,37 +254,88 @@ init_session_state()
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
-def run_emotion_analysis(text_list: List[str], threshold: float = 0.3) -> Dict[str, Any]:
-    """Run emotion analysis on list of texts"""
+def clean_comments(comments: pd.Series) -> List[str]:
+    """Strip comments and drop empty and duplicate ones, keeping first-seen order"""
+    comments = comments.dropna().astype(str).str.strip()
+    return comments[comments != ""].drop_duplicates().tolist()
+
+
+def run_emotion_analysis(text_list: List[str], threshold: float = 0.3, on_progress=None) -> Dict[str, Any]:
+    """Run emotion analysis on list of texts, reporting on_progress(done, total) per mini-batch"""
     all_results = []
-    emotion_sum = {e: 0.0 for e in EMOTIONS}
-    emotion_counts = {e: 0 for e in EMOTIONS}
     
-    for text in text_list:
-        if not text or not text.strip():
-            continue
-        
-        predicted_emotions, probabilities = predict_emotions(text, threshold=threshold)
+    texts = [text for text in text_list if text and text.strip()]
+    # Score each distinct comment once (cached per chunk, so re-analyzing the
+    # same input skips inference), then expand back so repeats keep their weight
+    codes, unique_texts = pd.factorize(pd.Series(texts, dtype=object))
+    probs_matrix = predict_comment_probs(unique_texts.tolist(), on_progress=on_progress)[codes]
+    
+    # Drop comments that could not be scored (NaN rows)
+    scored = ~np.isnan(probs_matrix).any(axis=1)
+    scored_probs = probs_matrix[scored]
+    
+    scored_texts = [text for text, ok in zip(texts, scored) if ok]
+    
+    # One threshold mask serves the per-comment predictions and the counts
+    above_threshold = scored_probs >= threshold
+    
+    for text, probs, mask in zip(scored_texts, scored_probs.tolist(), above_threshold):
+        probabilities = dict(zip(EMOTIONS, probs))
+        predicted_emotions = EMOTION_NAMES[mask].tolist()
         all_results.append((text, predicted_emotions, probabilities))
-        
-        for emotion, prob in probabilities.items():
-            emotion_sum[emotion] += prob
-            if prob >= threshold:
-                emotion_counts[emotion] += 1
+    
+    # Per-emotion totals and above-threshold counts as column reductions
+    emotion_sum = scored_probs.sum(axis=0, dtype=np.float64)
+    emotion_counts = dict(zip(EMOTIONS, above_threshold.sum(axis=0).tolist()))
     
     n = len(text_list) if text_list else 1
-    aggregated_emotions = {e: emotion_sum[e] / n for e in EMOTIONS}
-    dominant_emotion = max(aggregated_emotions.items(), key=lambda x: x[1])[0]
+    aggregated_emotions = dict(zip(EMOTIONS, (emotion_sum / n).tolist()))
+    # Sorted once here; the chart, strengths and chat context reuse it
+    sorted_emotions = sorted(aggregated_emotions.items(), key=lambda x: x[1], reverse=True)
+    dominant_emotion = sorted_emotions[0][0]
     
     return {
         'all_results': all_results,
         'aggregated_emotions': aggregated_emotions,
+        'sorted_emotions': sorted_emotions,
         'dominant_emotion': dominant_emotion,
         'emotion_counts': emotion_counts,
         'total_analyzed': len(all_results)
     }
 
 
+@st.cache_resource(show_spinner=False)
+def load_summary_service():
+    """
+    Import the summarization service the first time an analysis needs it
+    
+    Opening the page, or only chatting, doesn't import the summary
+    services at all.
+    
+    Returns:
+        (summarize_fn, combine_emotion_and_summary) from the local BART
+        service, or from the API service if the local one can't be imported
+    """
+    try:
+        from services.summary_service_local import summarize_text_local, combine_emotion_and_summary
+        return summarize_text_local, combine_emotion_and_summary
+    except ImportError:
+        from services.summary_service import summarize_text, combine_emotion_and_summary
+        return summarize_text, combine_emotion_and_summary
+
+
+def summarize_feedback(text: str) -> str:
+    """
+    Summarize text with the local BART model, or the API service if it isn't available
+    
+    Both services cache results with st.cache_data on the text. Whitespace
+    is collapsed first (the services' clean_text does the same), so
+    re-pastes that differ only in spacing or line breaks hit the cache.
+    """
+    summarize, _ = load_summary_service()
+    return summarize(" ".join(text.split()))
+
+
 def run_bart_summary(text_list: List[str]) -> Dict[str, Any]:
     """Generate micro and macro summaries using BART"""
     micro_summaries = []
@@ -197,21 +344,10 @@ def run_bart_summary(text_list: List[str]) -> Dict[str, Any]:
         if not text or len(text.strip()) < 20:
             continue
         
-        if USE_LOCAL_SUMMARY:
-            summary = summarize_text_local(text)
-        else:
-            from services.summary_service import summarize_text
-            summary = summarize_text(text)
-        
-        micro_summaries.append(summary)
+        micro_summaries.append(summarize_feedback(text))
     
     combined_text = " ".join(text_list[:100])
-    
-    if USE_LOCAL_SUMMARY:
-        macro_summary = summarize_text_local(combined_text)
-    else:
-        from services.summary_service import summarize_text
-        macro_summary = summarize_text(combined_text)
+    macro_summary = summarize_feedback(combined_text)
     
     return {
         'micro_summaries': micro_summaries,
@@ -221,8 +357,6 @@ def run_bart_summary(text_list: List[str]) -> Dict[str, Any]:
 
 def extract_themes_from_comments(comments: List[str]) -> List[str]:
     """Extract key themes/keywords from comments using simple frequency analysis"""
-    from collections import Counter
-    import re
     
     # Common words to ignore
     stop_words = {'the', 'is', 'it', 'and', 'to', 'a', 'of', 'for', 'in', 'on', 'this', 'that', 'with', 'are', 'was', 'be', 'have', 'has', 'but', 'not', 'can', 'my', 'i', 'you', 'your', 'me', 'so', 'very', 'just', 'will', 'at', 'from', 'they', 'we', 'or', 'an', 'as', 'by', 'been', 'all', 'would', 'there', 'their'}
@@ -230,7 +364,7 @@ def extract_themes_from_comments(comments: List[str]) -> List[str]:
     all_words = []
     for comment in comments:
         # Extract words (2+ chars, alphabetic)
-        words = re.findall(r'\b[a-z]{2,}\b', comment.lower())
+        words = WORD_PATTERN.findall(comment.lower())
         all_words.extend([w for w in words if w not in stop_words])
     
     # Count frequency
@@ -262,6 +396,7 @@ def run_rag_llm_analysis(
         crisis_alerts = detect_crisis_keywords(raw_comments)
         crisis_flags = [alert['keyword'] for alert in crisis_alerts]
     
+    _, combine_emotion_and_summary = load_summary_service()
     result = combine_emotion_and_summary(
         emotion_output=emotion_output,
         summary=summary,
@@ -280,11 +415,14 @@ def run_rag_llm_analysis(
 
 def compute_sentiment_breakdown(emotions: Dict[str, float]) -> Dict[str, Any]:
     """Compute sentiment statistics"""
-    positive_emotions = ["joy", "love", "gratitude", "admiration", "excitement", "optimism", "pride", "relief"]
-    negative_emotions = ["anger", "sadness", "fear", "disappointment", "disgust", "annoyance", "disapproval", "embarrassment"]
-    
-    positive_score = min(sum([emotions.get(e, 0.0) for e in positive_emotions]), 1.0)
-    negative_score = min(sum([emotions.get(e, 0.0) for e in negative_emotions]), 1.0)
+    positive_total = negative_total = 0.0
+    for emotion, prob in emotions.items():
+        if emotion in POSITIVE_EMOTIONS:
+            positive_total += prob
+        elif emotion in NEGATIVE_EMOTIONS:
+            negative_total += prob
+    positive_score = min(positive_total, 1.0)
+    negative_score = min(negative_total, 1.0)
     neutral_score = 1.0 - positive_score - negative_score
     
     if positive_score > negative_score:
@@ -330,11 +468,11 @@ def detect_crisis_keywords(text_list: List[str]) -> List[Dict[str, Any]]:
     return alerts
 
 
-def prepare_business_report() -> Dict[str, Any]:
+def prepare_business_report(generated_at: datetime) -> Dict[str, Any]:
     """Prepare comprehensive business report from session state"""
     return {
         "report_metadata": {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at.isoformat(),
             "report_type": "business_buddy_analysis",
             "tool": "EmoSense AI Business Buddy",
             "comments_analyzed": len(st.session_state.analysis_raw_comments)
@@ -366,21 +504,18 @@ def get_openai_client() -> Optional[OpenAI]:
         return None
 
 
-def extract_strengths_and_weaknesses(emotions: Dict[str, float], comments: List[str]) -> Dict[str, List[str]]:
-    """Extract strengths and weaknesses from emotions and comments"""
-    positive_emotions = ["joy", "love", "gratitude", "admiration", "excitement", "optimism", "pride", "relief"]
-    negative_emotions = ["anger", "sadness", "fear", "disappointment", "disgust", "annoyance", "disapproval", "embarrassment", "confusion", "frustration"]
-    
+def extract_strengths_and_weaknesses(sorted_emotions: List[Tuple[str, float]], comments: List[str]) -> Dict[str, List[str]]:
+    """Extract strengths and weaknesses from emotions (sorted by probability) and comments"""
     strengths = []
     weaknesses = []
     
     # Analyze emotions
-    for emotion, score in sorted(emotions.items(), key=lambda x: x[1], reverse=True):
+    for emotion, score in sorted_emotions:
         if score > 0.2:  # Significant presence
-            if emotion in positive_emotions:
-                strengths.append(f"{emotion.capitalize()} ({score:.0%})")
-            elif emotion in negative_emotions:
-                weaknesses.append(f"{emotion.capitalize()} ({score:.0%})")
+            if emotion in POSITIVE_EMOTIONS:
+                strengths.append(f"{EMOTION_DISPLAY[emotion]} ({score:.0%})")
+            elif emotion in WEAKNESS_EMOTIONS:
+                weaknesses.append(f"{EMOTION_DISPLAY[emotion]} ({score:.0%})")
     
     return {
         "strengths": strengths[:5],  # Top 5
@@ -393,7 +528,7 @@ def build_persistent_chat_context():
     Build persistent chat context from analysis results.
     This context is stored in session state and reused across all chat turns.
     """
-    emotions = st.session_state.analysis_emotions.get('aggregated_emotions', {})
+    sorted_emotions = st.session_state.analysis_emotions.get('sorted_emotions', [])
     sentiments = st.session_state.analysis_sentiments
     summary = st.session_state.analysis_summary.get('macro_summary', '')
     micro_summaries = st.session_state.analysis_summary.get('micro_summaries', [])
@@ -407,7 +542,7 @@ def build_persistent_chat_context():
     
     # Extract and store strengths/weaknesses (persistent)
     if not st.session_state.extracted_strengths or not st.session_state.extracted_weaknesses:
-        sw = extract_strengths_and_weaknesses(emotions, comments)
+        sw = extract_strengths_and_weaknesses(sorted_emotions, comments)
         st.session_state.extracted_strengths = sw['strengths']
         st.session_state.extracted_weaknesses = sw['weaknesses']
     
@@ -428,26 +563,27 @@ def build_persistent_chat_context():
 """
     
     # 2. Top Emotions (top 10)
-    top_emotions = sorted(emotions.items(), key=lambda x: x[1], reverse=True)[:10]
-    emotions_text = "**🎭 TOP EMOTIONS DETECTED:**\n"
+    top_emotions = sorted_emotions[:10]
+    emotions_lines = ["**🎭 TOP EMOTIONS DETECTED:**\n"]
     for emotion, prob in top_emotions:
-        emotions_text += f"  - {emotion.capitalize()}: {prob:.1%}\n"
+        emotions_lines.append(f"  - {EMOTION_DISPLAY[emotion]}: {prob:.1%}\n")
+    emotions_text = "".join(emotions_lines)
     
     # 3. Strengths
-    strengths_text = "**💪 STRENGTHS (Positive Signals):**\n"
+    strengths_lines = ["**💪 STRENGTHS (Positive Signals):**\n"]
     if strengths:
-        for s in strengths:
-            strengths_text += f"  ✅ {s}\n"
+        strengths_lines.extend(f"  ✅ {s}\n" for s in strengths)
     else:
-        strengths_text += "  (No significant positive emotions detected)\n"
+        strengths_lines.append("  (No significant positive emotions detected)\n")
+    strengths_text = "".join(strengths_lines)
     
     # 4. Weaknesses
-    weaknesses_text = "**⚠️ WEAKNESSES (Negative Signals):**\n"
+    weaknesses_lines = ["**⚠️ WEAKNESSES (Negative Signals):**\n"]
     if weaknesses:
-        for w in weaknesses:
-            weaknesses_text += f"  ❌ {w}\n"
+        weaknesses_lines.extend(f"  ❌ {w}\n" for w in weaknesses)
     else:
-        weaknesses_text += "  (No significant negative emotions detected)\n"
+        weaknesses_lines.append("  (No significant negative emotions detected)\n")
+    weaknesses_text = "".join(weaknesses_lines)
     
     # 5. Themes
     themes_text = f"**🔍 KEY THEMES (Extracted Keywords):**\n{', '.join(themes[:15]) if themes else 'No themes extracted'}\n"
@@ -462,9 +598,10 @@ def build_persistent_chat_context():
                 crisis_categories[cat] = []
             crisis_categories[cat].append(alert['keyword'])
         
-        crisis_text = "\n**🚨 CRISIS FLAGS DETECTED:**\n"
+        crisis_lines = ["\n**🚨 CRISIS FLAGS DETECTED:**\n"]
         for cat, keywords in crisis_categories.items():
-            crisis_text += f"  - {cat.capitalize()}: {', '.join(set(keywords))}\n"
+            crisis_lines.append(f"  - {cat.capitalize()}: {', '.join(set(keywords))}\n")
+        crisis_text = "".join(crisis_lines)
     else:
         crisis_text = "\n**✅ NO CRISIS FLAGS DETECTED**\n"
     
@@ -476,22 +613,24 @@ def build_persistent_chat_context():
     
     # 8. Raw Comments (sample - up to 20)
     comments_sample = comments[:20] if len(comments) > 20 else comments
-    comments_text = f"**📄 CUSTOMER COMMENTS ({len(comments_sample)} of {len(comments)} total):**\n"
+    comments_lines = [f"**📄 CUSTOMER COMMENTS ({len(comments_sample)} of {len(comments)} total):**\n"]
     for i, comment in enumerate(comments_sample, 1):
         comment_truncated = comment[:200] + "..." if len(comment) > 200 else comment
-        comments_text += f'{i}. "{comment_truncated}"\n'
+        comments_lines.append(f'{i}. "{comment_truncated}"\n')
+    comments_text = "".join(comments_lines)
     
     # 9. Micro Summaries (if available)
     micro_text = ""
     if micro_summaries and len(micro_summaries) > 0:
-        micro_text = f"\n**📋 MICRO SUMMARIES (First 5):**\n"
+        micro_lines = [f"\n**📋 MICRO SUMMARIES (First 5):**\n"]
         for i, ms in enumerate(micro_summaries[:5], 1):
             # Handle both string and dict formats
             if isinstance(ms, dict):
                 summary_content = ms.get("summary", "N/A")
             else:
                 summary_content = str(ms)
-            micro_text += f'{i}. {summary_content}\n'
+            micro_lines.append(f'{i}. {summary_content}\n')
+        micro_text = "".join(micro_lines)
     
     # 10. AI Insights
     insights_text = f"""
@@ -502,43 +641,46 @@ def build_persistent_chat_context():
     # 11. RAG Context (if available)
     rag_text = ""
     if insights.get('sources'):
-        rag_text = "\n**📚 RELEVANT MARKET RESEARCH:**\n"
+        rag_lines = ["\n**📚 RELEVANT MARKET RESEARCH:**\n"]
         for source in insights.get('sources', [])[:3]:
-            rag_text += f"  - {source.get('title', 'Unknown')} ({source.get('category', 'General')})\n"
+            rag_lines.append(f"  - {source.get('title', 'Unknown')} ({source.get('category', 'General')})\n")
+        rag_text = "".join(rag_lines)
     
     # 12. Pain Point Clusters (NEW)
     clusters_text = ""
     if st.session_state.pain_point_clusters and st.session_state.pain_point_clusters.get('clusters'):
         clusters = st.session_state.pain_point_clusters['clusters']
-        clusters_text = f"\n**🎯 PAIN POINT CLUSTERS ({len(clusters)} clusters identified):**\n"
+        clusters_lines = [f"\n**🎯 PAIN POINT CLUSTERS ({len(clusters)} clusters identified):**\n"]
         for cluster in clusters:
-            clusters_text += f"""
+            clusters_lines.append(f"""
   Cluster {cluster['cluster_id']}: {cluster['theme_name']}
     - Size: {cluster['size']} comments ({cluster['percentage']:.1f}%)
     - Keywords: {', '.join(cluster['theme_keywords'])}
     - Sentiment: {cluster['sentiment_summary']['status']}
     - Example: "{cluster['comment_examples'][0][:100]}..."
-"""
+""")
+        clusters_text = "".join(clusters_lines)
     
     # 13. Root Causes (NEW)
     root_causes_text = ""
     if st.session_state.root_causes and st.session_state.root_causes.get('root_causes'):
         root_causes = st.session_state.root_causes['root_causes']
-        root_causes_text = f"\n**🔬 ROOT CAUSE ANALYSIS ({len(root_causes)} causes identified):**\n"
+        root_causes_lines = [f"\n**🔬 ROOT CAUSE ANALYSIS ({len(root_causes)} causes identified):**\n"]
         for rc in root_causes:
             evidence_preview = rc['evidence'][0][:80] + "..." if rc['evidence'] else "No evidence"
-            root_causes_text += f"""
+            root_causes_lines.append(f"""
   {rc['theme_name']}:
     - Root Cause: {rc['root_cause'][:150]}...
     - Evidence: "{evidence_preview}"
     - Action: {rc['actionable_insight'][:100]}...
-"""
+""")
+        root_causes_text = "".join(root_causes_lines)
     
     # 14. Viral Signals (NEW)
     viral_text = ""
     if st.session_state.viral_signals:
         vs = st.session_state.viral_signals
-        viral_text = f"""
+        viral_lines = [f"""
 **🔥 VIRAL CONTENT SIGNALS:**
   - Viral Score: {vs['viral_score']}/100 ({vs['viral_level']} potential)
   - Positivity: {vs['signals_detected'].get('positivity_index', 0):.2f}
@@ -548,11 +690,12 @@ def build_persistent_chat_context():
   - Trend Alignment: {vs['signals_detected'].get('trend_alignment_score', 0):.2f}
   - Repetition: {vs['signals_detected'].get('repetition_score', 0):.2f}
   - Explanation: {vs['explanation']}
-"""
+"""]
         if vs.get('top_viral_comments'):
-            viral_text += f"  - Top Viral Comments:\n"
+            viral_lines.append(f"  - Top Viral Comments:\n")
             for i, comment in enumerate(vs['top_viral_comments'][:3], 1):
-                viral_text += f'    {i}. "{comment[:100]}..."\n'
+                viral_lines.append(f'    {i}. "{comment[:100]}..."\n')
+        viral_text = "".join(viral_lines)
     
     # Combine everything
     full_context = f"""
@@ -787,7 +930,15 @@ def handle_business_chat_query(user_message: str) -> str:
 # UI RENDERING FUNCTIONS
 # ============================================================================
 
-import re
+# Markdown patterns used by format_markdown_to_html
+MD_BOLD_PATTERN = re.compile(r'\*\*(.+?)\*\*')
+MD_ITALIC_PATTERN = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+MD_NUMBERED_PATTERN = re.compile(r'^(\d+)\.\s+', flags=re.MULTILINE)
+MD_BULLET_PATTERN = re.compile(r'^-\s+', flags=re.MULTILINE)
+
+# Words of 2+ letters for keyword extraction
+WORD_PATTERN = re.compile(r'\b[a-z]{2,}\b')
+
 
 def format_markdown_to_html(text: str) -> str:
     """
@@ -798,39 +949,40 @@ def format_markdown_to_html(text: str) -> str:
         return text
     
     # Convert **bold** to <strong>bold</strong>
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = MD_BOLD_PATTERN.sub(r'<strong>\1</strong>', text)
     
     # Convert *italic* to <em>italic</em> (but not inside already converted strong tags)
-    text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'<em>\1</em>', text)
+    text = MD_ITALIC_PATTERN.sub(r'<em>\1</em>', text)
     
     # Convert numbered lists (1. item) to proper formatting
-    text = re.sub(r'^(\d+)\.\s+', r'<strong>\1.</strong> ', text, flags=re.MULTILINE)
+    text = MD_NUMBERED_PATTERN.sub(r'<strong>\1.</strong> ', text)
     
     # Convert - bullet points to styled bullets
-    text = re.sub(r'^-\s+', r'• ', text, flags=re.MULTILINE)
+    text = MD_BULLET_PATTERN.sub(r'• ', text)
     
     return text
 
 
-def render_emotion_distribution_chart(emotions: Dict[str, float]):
-    """Render emotion distribution bar chart"""
-    sorted_emotions = sorted(emotions.items(), key=lambda x: x[1], reverse=True)[:10]
+def render_emotion_distribution_chart(sorted_emotions: List[Tuple[str, float]]):
+    """Render emotion distribution bar chart from emotions sorted by probability"""
+    sorted_emotions = sorted_emotions[:10]
     
     if not PLOTLY_AVAILABLE:
         # Fallback: Simple text display
         st.markdown("### Top 10 Detected Emotions")
-        for emotion, prob in sorted_emotions:
-            emoji = EMOJI_MAP.get(emotion, "🎭")
-            st.markdown(f"""
-            <div style="display: flex; justify-content: space-between; padding: 8px; 
-                        background: rgba(255,255,255,0.05); margin: 4px 0; border-radius: 8px;">
-                <span style="color: #FFFFFF;">{emoji} {emotion.capitalize()}</span>
-                <span style="color: #8A5CF6; font-weight: bold;">{prob*100:.1f}%</span>
-            </div>
-            """, unsafe_allow_html=True)
+        # All rows go out as one element instead of one st.markdown per emotion
+        rows_html = "".join(
+            '<div style="display: flex; justify-content: space-between; padding: 8px; '
+            'background: rgba(255,255,255,0.05); margin: 4px 0; border-radius: 8px;">'
+            f'<span style="color: #FFFFFF;">{EMOJI_MAP.get(emotion, "🎭")} {EMOTION_DISPLAY[emotion]}</span>'
+            f'<span style="color: #8A5CF6; font-weight: bold;">{prob*100:.1f}%</span>'
+            '</div>'
+            for emotion, prob in sorted_emotions
+        )
+        st.markdown(rows_html, unsafe_allow_html=True)
         return
     
-    emotion_names = [e[0].capitalize() for e in sorted_emotions]
+    emotion_names = [EMOTION_DISPLAY[e[0]] for e in sorted_emotions]
     emotion_values = [e[1] * 100 for e in sorted_emotions]
     emotion_emojis = [EMOJI_MAP.get(e[0], "🎭") for e in sorted_emotions]
     
@@ -928,8 +1080,71 @@ def render_sentiment_pie_chart(sentiments: Dict[str, float]):
     st.plotly_chart(fig, use_container_width=True)
 
 
+def render_chat_message(msg: Dict[str, Any]):
+    """Render one Business Buddy chat message (user, assistant or comparison)"""
+    if msg["role"] == "user":
+        st.markdown(f"""
+        <div class="chat-bubble chat-user">
+            {msg['content']}
+        </div>
+        <div style="clear: both;"></div>
+        """, unsafe_allow_html=True)
+    elif msg["role"] == "comparison":
+        # Side-by-side comparison display (styles come from COMPARISON_CSS)
+        
+        col_raw, col_refined = st.columns(2)
+        
+        # Markdown is converted to HTML once, when the message is stored
+        raw_formatted = msg.get('raw_html') or format_markdown_to_html(msg['raw_response'])
+        refined_formatted = msg.get('refined_html') or format_markdown_to_html(msg['refined_response'])
+        
+        with col_raw:
+            st.markdown(f"""
+            <div class="comparison-card raw">
+                <div class="comparison-header raw">
+                    <span style="font-size: 1.5rem;">🤖</span>
+                    <h4 class="comparison-title raw">Raw ChatGPT</h4>
+                    <span class="comparison-badge raw">Basic</span>
+                </div>
+                <div class="comparison-content raw">
+                    {raw_formatted}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col_refined:
+            st.markdown(f"""
+            <div class="comparison-card refined">
+                <div class="comparison-header refined">
+                    <span style="font-size: 1.5rem;">✨</span>
+                    <h4 class="comparison-title refined">Business Buddy</h4>
+                    <span class="comparison-badge refined">Enhanced</span>
+                </div>
+                <div class="comparison-content refined">
+                    {refined_formatted}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        spacer("sm")
+    else:
+        # Regular assistant response (non-comparison mode)
+        st.markdown(f"""
+        <div class="chat-bubble chat-ai">
+            {msg['content']}
+        </div>
+        <div style="clear: both;"></div>
+        """, unsafe_allow_html=True)
+
+
+@st.fragment
 def render_chat_interface():
-    """Render Business Buddy chat interface with Raw vs Refined comparison"""
+    """
+    Render Business Buddy chat interface with Raw vs Refined comparison.
+
+    Runs as a fragment so sending, clearing or toggling comparison only
+    reruns the chat, not the dashboards and charts above it.
+    """
     
     # Root Cause Insight Section Header (appears once above chat)
     st.markdown("""
@@ -971,143 +1186,22 @@ def render_chat_interface():
     
     spacer("sm")
     
-    # Display chat history
-    if st.session_state.business_chat_history:
-        for msg in st.session_state.business_chat_history:
-            if msg["role"] == "user":
-                st.markdown(f"""
-                <div class="chat-bubble chat-user">
-                    {msg['content']}
-                </div>
-                <div style="clear: both;"></div>
-                """, unsafe_allow_html=True)
-            elif msg["role"] == "comparison":
-                # Side-by-side comparison display with improved UI
-                st.markdown("""
-                <style>
-                .comparison-container {
-                    display: flex;
-                    gap: 1rem;
-                    margin: 1rem 0;
-                }
-                .comparison-card {
-                    flex: 1;
-                    border-radius: 16px;
-                    padding: 24px;
-                    min-height: 300px;
-                }
-                .comparison-card.raw {
-                    background: rgba(55, 65, 81, 0.3);
-                    border: 1px solid rgba(107, 114, 128, 0.4);
-                }
-                .comparison-card.refined {
-                    background: linear-gradient(135deg, rgba(138, 92, 246, 0.2), rgba(59, 130, 246, 0.15));
-                    border: 2px solid rgba(138, 92, 246, 0.5);
-                    box-shadow: 0 4px 20px rgba(138, 92, 246, 0.2);
-                }
-                .comparison-header {
-                    display: flex;
-                    align-items: center;
-                    gap: 0.5rem;
-                    margin-bottom: 1rem;
-                    padding-bottom: 0.75rem;
-                    border-bottom: 2px solid rgba(255,255,255,0.1);
-                }
-                .comparison-header.raw {
-                    border-bottom-color: rgba(107, 114, 128, 0.4);
-                }
-                .comparison-header.refined {
-                    border-bottom-color: rgba(138, 92, 246, 0.5);
-                }
-                .comparison-title {
-                    font-size: 1.1rem;
-                    font-weight: 600;
-                    margin: 0;
-                }
-                .comparison-title.raw {
-                    color: #9CA3AF;
-                }
-                .comparison-title.refined {
-                    color: #A78BFA;
-                }
-                .comparison-badge {
-                    padding: 0.25rem 0.75rem;
-                    border-radius: 20px;
-                    font-size: 0.7rem;
-                    font-weight: 600;
-                    text-transform: uppercase;
-                }
-                .comparison-badge.raw {
-                    background: rgba(107, 114, 128, 0.3);
-                    color: #9CA3AF;
-                }
-                .comparison-badge.refined {
-                    background: rgba(138, 92, 246, 0.3);
-                    color: #A78BFA;
-                }
-                .comparison-content {
-                    line-height: 1.8;
-                    font-size: 0.92rem;
-                }
-                .comparison-content.raw {
-                    color: #D1D5DB;
-                }
-                .comparison-content.refined {
-                    color: #F3F4F6;
-                }
-                .comparison-content strong {
-                    color: #FFFFFF;
-                    font-weight: 600;
-                }
-                .comparison-content.refined strong {
-                    color: #C4B5FD;
-                }
-                </style>
-                """, unsafe_allow_html=True)
-                
-                col_raw, col_refined = st.columns(2)
-                
-                # Format the responses to convert markdown to HTML
-                raw_formatted = format_markdown_to_html(msg['raw_response'])
-                refined_formatted = format_markdown_to_html(msg['refined_response'])
-                
-                with col_raw:
-                    st.markdown(f"""
-                    <div class="comparison-card raw">
-                        <div class="comparison-header raw">
-                            <span style="font-size: 1.5rem;">🤖</span>
-                            <h4 class="comparison-title raw">Raw ChatGPT</h4>
-                            <span class="comparison-badge raw">Basic</span>
-                        </div>
-                        <div class="comparison-content raw">
-                            {raw_formatted}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col_refined:
-                    st.markdown(f"""
-                    <div class="comparison-card refined">
-                        <div class="comparison-header refined">
-                            <span style="font-size: 1.5rem;">✨</span>
-                            <h4 class="comparison-title refined">Business Buddy</h4>
-                            <span class="comparison-badge refined">Enhanced</span>
-                        </div>
-                        <div class="comparison-content refined">
-                            {refined_formatted}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                spacer("sm")
-            else:
-                # Regular assistant response (non-comparison mode)
-                st.markdown(f"""
-                <div class="chat-bubble chat-ai">
-                    {msg['content']}
-                </div>
-                <div style="clear: both;"></div>
-                """, unsafe_allow_html=True)
+    # Display chat history: the latest messages, older ones only on request
+    history = st.session_state.business_chat_history
+    if history:
+        if any(msg["role"] == "comparison" for msg in history):
+            st.markdown(COMPARISON_CSS, unsafe_allow_html=True)
+        
+        older_messages = history[:-CHAT_HISTORY_RENDER_LIMIT]
+        if older_messages and st.checkbox(
+            f"📜 Show full history ({len(older_messages)} earlier messages)",
+            key="show_full_chat_history"
+        ):
+            for msg in older_messages:
+                render_chat_message(msg)
+        
+        for msg in history[-CHAT_HISTORY_RENDER_LIMIT:]:
+            render_chat_message(msg)
         
         spacer("sm")
     
@@ -1156,11 +1250,15 @@ def render_chat_interface():
                 # Get refined Business Buddy response (with context)
                 refined_response = handle_business_chat_query(question_to_send)
             
-            # Store comparison response
+            # Store comparison response, with its HTML rendered once up front
+            raw_response = raw_response.replace('\n', '<br>')
+            refined_response = refined_response.replace('\n', '<br>')
             st.session_state.business_chat_history.append({
                 "role": "comparison",
-                "raw_response": raw_response.replace('\n', '<br>'),
-                "refined_response": refined_response.replace('\n', '<br>')
+                "raw_response": raw_response,
+                "refined_response": refined_response,
+                "raw_html": format_markdown_to_html(raw_response),
+                "refined_html": format_markdown_to_html(refined_response)
             })
         else:
             # NORMAL MODE: Just get Business Buddy response
@@ -1172,12 +1270,15 @@ def render_chat_interface():
                 "content": response
             })
         
-        st.rerun()
+        # Keep session memory bounded: drop the oldest messages past the cap
+        del st.session_state.business_chat_history[:-CHAT_HISTORY_MAX_MESSAGES]
+        
+        st.rerun(scope="fragment")
     
     if st.session_state.business_chat_history:
         if st.button("🗑️ Clear Chat History", use_container_width=True):
             st.session_state.business_chat_history = []
-            st.rerun()
+            st.rerun(scope="fragment")
 
 
 # ============================================================================
@@ -1236,10 +1337,9 @@ with page_container():
         )
         
         if text_input:
-            raw_lines = text_input.strip().split('\n')
-            csv_comments = [line.strip() for line in raw_lines if line.strip()]
+            csv_comments = clean_comments(pd.Series(text_input.splitlines(), dtype=object))
             if len(csv_comments) > 1:
-                st.info(f"Detected {len(csv_comments)} comments (one per line)")
+                st.info(f"Detected {len(csv_comments)} unique comments (one per line)")
             else:
                 st.info("Analyzing 1 comment")
     else:
@@ -1251,21 +1351,30 @@ with page_container():
         
         if uploaded_file:
             try:
-                df = pd.read_csv(uploaded_file)
-                st.success(f"Loaded {len(df)} rows from CSV")
+                # Read only the header to offer every column, then load just the chosen one
+                header = pd.read_csv(uploaded_file, nrows=0).columns
                 
-                text_columns = df.select_dtypes(include=['object']).columns.tolist()
-                
-                if text_columns:
+                if len(header):
+                    # Preselect the first column with a familiar comment header
+                    is_comment_column = header.str.strip().str.lower().isin(COMMENT_COLUMN_NAMES)
                     comment_column = st.selectbox(
                         "Select the column containing comments:",
-                        text_columns
+                        header.tolist(),
+                        index=int(is_comment_column.argmax()) if is_comment_column.any() else 0
                     )
                     
-                    csv_comments = df[comment_column].dropna().astype(str).tolist()
-                    st.info(f"Found {len(csv_comments)} valid comments")
+                    uploaded_file.seek(0)
+                    comment_series = pd.read_csv(
+                        uploaded_file,
+                        usecols=[comment_column],
+                        dtype={comment_column: str}
+                    )[comment_column]
+                    st.success(f"Loaded {len(comment_series)} rows from CSV")
+                    
+                    csv_comments = clean_comments(comment_series)
+                    st.info(f"Found {len(csv_comments)} unique comments")
                 else:
-                    st.error("No text columns found in CSV")
+                    st.error("No columns found in CSV")
             
             except Exception as e:
                 st.error(f"Error reading CSV: {str(e)}")
@@ -1312,7 +1421,12 @@ with page_container():
             
             status_text.text("🎭 Analyzing emotions...")
             progress_bar.progress(20)
-            emotion_results = run_emotion_analysis(csv_comments, threshold=threshold)
+            # Advance the bar from 20% to 40% as each mini-batch is scored
+            emotion_results = run_emotion_analysis(
+                csv_comments,
+                threshold=threshold,
+                on_progress=lambda done, total: progress_bar.progress(20 + 20 * done // total)
+            )
             st.session_state.analysis_emotions = emotion_results
             
             status_text.text("📝 Generating summaries...")
@@ -1428,7 +1542,12 @@ with page_container():
             st.session_state.chat_context_built = False
             st.session_state.chat_system_prompt = ""
             
-            import time
+            # Serialize the report now so reruns don't redo it before every download render;
+            # one timestamp serves both the payload and the file name
+            generated_at = datetime.now()
+            st.session_state.report_json = dumps_json(prepare_business_report(generated_at))
+            st.session_state.report_file_name = f"business_buddy_report_{generated_at.strftime('%Y%m%d_%H%M%S')}.json"
+            
             time.sleep(0.5)
             progress_bar.empty()
             status_text.empty()
@@ -1468,7 +1587,7 @@ with page_container():
         
         with col1:
             render_emotion_distribution_chart(
-                st.session_state.analysis_emotions['aggregated_emotions']
+                st.session_state.analysis_emotions['sorted_emotions']
             )
         
         with col2:
@@ -1482,7 +1601,7 @@ with page_container():
                 <div style="font-size: 3rem; margin: 1rem 0;">
                     {EMOJI_MAP.get(dominant, '🎭')}
                 </div>
-                <h3 style="color: #FFFFFF; margin: 0.5rem 0;">{dominant.capitalize()}</h3>
+                <h3 style="color: #FFFFFF; margin: 0.5rem 0;">{EMOTION_DISPLAY[dominant]}</h3>
                 <p style="color: #A8A9B3; font-size: 1.2rem; margin: 0;">
                     {dominant_prob:.1%} confidence
                 </p>
@@ -1556,14 +1675,12 @@ with page_container():
         
         with col2:
             st.markdown("<div style='padding-top: 20px;'></div>", unsafe_allow_html=True)
-            report_json = prepare_business_report()
-            json_data = json.dumps(report_json, indent=2)
-            
             st.download_button(
                 label="📥 Download Report",
-                data=json_data,
-                file_name=f"business_buddy_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                data=st.session_state.report_json,
+                file_name=st.session_state.report_file_name,
                 mime="application/json",
+                on_click="ignore",  # Downloading doesn't rerun the page
                 use_container_width=True
             )
         
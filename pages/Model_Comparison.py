@@ -12,7 +12,7 @@ import streamlit as st
 import pandas as pd
 from components.layout import set_page_config, inject_global_styles, page_container, gradient_hero, spacer
 from components.footer import render_footer
-from utils.predict import predict_emotions
+from utils.predict import submit_predict_emotions
 from services.logreg_emotion_service import get_logreg_service
 from services.svm_emotion_service import get_svm_service
 from utils.labels import EMOJI_MAP
@@ -154,8 +154,8 @@ with page_container():
     
     if compare_button and input_text.strip():
         with st.spinner("🤖 Running all three models..."):
-            # BERT prediction
-            bert_emotions, bert_probs = predict_emotions(input_text, threshold=threshold)
+            # BERT prediction (runs in the background while the sklearn models predict)
+            bert_future = submit_predict_emotions(input_text, threshold=threshold)
             
             # LogReg prediction
             if logreg_service.is_available():
@@ -169,6 +169,8 @@ with page_container():
             else:
                 svm_emotions, svm_probs = [], {}
             
+            bert_emotions, bert_probs = bert_future.result()
+            
             spacer("md")
             
             # Agreement Analysis
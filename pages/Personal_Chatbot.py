@@ -6,14 +6,15 @@ Enhanced with Big Five personality adaptation (Mini-IPIP-20)
 """
 import sys
 import os
-import hashlib
 
 # Fix import path for Streamlit Cloud
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import streamlit as st
-from utils.predict import predict_emotions
+from utils.predict import predict_emotions, predict_dominant_emotion
 from utils.labels import EMOJI_MAP
+from utils.audio import audio_fingerprint
+from utils.chat import is_trivial_message
 from components.layout import set_page_config, inject_global_styles, page_container, gradient_hero, emotion_chip, spacer, page_header, card
 from components.footer import render_footer
 from services.personal_llm_service import get_personal_llm_service
@@ -36,8 +37,13 @@ from services.big_five_service import (
     get_recommended_personality
 )
 import datetime
+from collections import deque
 from typing import Optional, Dict, List, Tuple
 
+# History bounds (deque drops the oldest entry on append)
+CHAT_HISTORY_MAXLEN = 20  # 10 exchanges
+EMOTION_HISTORY_MAXLEN = 10
+
 # Configure page
 set_page_config()
 inject_global_styles()
@@ -52,77 +58,53 @@ voice_service = get_voice_chat_service()
 # SESSION STATE INITIALIZATION
 # ============================================================
 
-# Companion mode: "choice" -> "onboarding" -> "chat" OR "choice" -> "chat"
-if "companion_mode" not in st.session_state:
-    st.session_state.companion_mode = "choice"  # "choice", "onboarding", "big_five", "chat"
-
-# Customization choice: None, "customized", "big_five", "general"
-if "customization_choice" not in st.session_state:
-    st.session_state.customization_choice = None
-
-# Onboarding state (COPE)
-if "onboarding_page" not in st.session_state:
-    st.session_state.onboarding_page = 0
-
-if "cope_answers" not in st.session_state:
-    st.session_state.cope_answers = {}
-
-if "cope_scores" not in st.session_state:
-    st.session_state.cope_scores = {}
-
-if "persona" not in st.session_state:
-    st.session_state.persona = None
-
-if "persona_info" not in st.session_state:
-    st.session_state.persona_info = None
-
-# Big Five personality state
-if "big_five_page" not in st.session_state:
-    st.session_state.big_five_page = 0
-
-if "big_five_answers" not in st.session_state:
-    st.session_state.big_five_answers = {}
-
-if "big_five_scores" not in st.session_state:
-    st.session_state.big_five_scores = None
-
-if "big_five_summary" not in st.session_state:
-    st.session_state.big_five_summary = None
-
-# Initialize session state for conversation memory
-if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []  # Last 10 messages
-
-if "emotion_history" not in st.session_state:
-    st.session_state.emotion_history = []  # Emotion analyses over time
-
-if "conversation_mode" not in st.session_state:
-    st.session_state.conversation_mode = "Casual Chat"
-
-if "bot_personality" not in st.session_state:
-    st.session_state.bot_personality = "Friendly"
-
-if "last_emotion_data" not in st.session_state:
-    st.session_state.last_emotion_data = None
-
-# Voice chat session state
-if "voice_chat_history" not in st.session_state:
-    st.session_state.voice_chat_history = []
-
-if "show_voice_emotion" not in st.session_state:
-    st.session_state.show_voice_emotion = True
+def session_defaults() -> Dict:
+    """Fresh default values for every session state key used by this page"""
+    return {
+        # Companion mode: "choice" -> "onboarding" -> "chat" OR "choice" -> "chat"
+        "companion_mode": "choice",  # "choice", "onboarding", "big_five", "chat"
+        
+        # Customization choice: None, "customized", "big_five", "general"
+        "customization_choice": None,
+        
+        # Onboarding state (COPE)
+        "onboarding_page": 0,
+        "cope_answers": {},
+        "cope_scores": {},
+        "persona": None,
+        "persona_info": None,
+        
+        # Big Five personality state
+        "big_five_page": 0,
+        "big_five_answers": {},
+        "big_five_scores": None,
+        "big_five_summary": None,
+        
+        # Conversation memory
+        "chat_history": deque(maxlen=CHAT_HISTORY_MAXLEN),
+        "emotion_history": deque(maxlen=EMOTION_HISTORY_MAXLEN),  # Emotion analyses over time
+        "conversation_mode": "Casual Chat",
+        "bot_personality": "Friendly",
+        "last_emotion_data": None,
+        
+        # Voice chat state
+        "voice_chat_history": [],
+        "show_voice_emotion": True,
+        "last_voice_audio": None,
+        "voice_processing": False,
+        "last_audio_hash": None,
+        "pending_tts_audio": None,
+    }
 
-if "last_voice_audio" not in st.session_state:
-    st.session_state.last_voice_audio = None
 
-if "voice_processing" not in st.session_state:
-    st.session_state.voice_processing = False
+def reset_session_state(*keys: str):
+    """Restore the given session state keys to their defaults in one update"""
+    defaults = session_defaults()
+    st.session_state.update({key: defaults[key] for key in keys})
 
-if "last_audio_hash" not in st.session_state:
-    st.session_state.last_audio_hash = None
 
-if "pending_tts_audio" not in st.session_state:
-    st.session_state.pending_tts_audio = None
+for _key, _value in session_defaults().items():
+    st.session_state.setdefault(_key, _value)
 
 # Map persona to bot personality (from onboarding)
 PERSONA_TO_PERSONALITY = {
@@ -133,6 +115,31 @@ PERSONA_TO_PERSONALITY = {
     "Motivational Guide": "Friendly"
 }
 
+# Chat settings options (module-level so reruns don't rebuild them)
+CONVERSATION_MODES = ("Casual Chat", "Comfort Me", "Help Me Reflect", "Hype Me Up", "Just Listen")
+PERSONALITY_OPTIONS = ("Friendly", "Calm", "Big Sister", "Funny", "Deep Thinker")
+
+MODE_DESCRIPTIONS = {
+    "Casual Chat": "💬 Natural, friendly conversation",
+    "Comfort Me": "🤗 Gentle support and grounding",
+    "Help Me Reflect": "🤔 Thoughtful exploration (auto emotion analysis)",
+    "Hype Me Up": "🔥 Energizing cheerleader mode",
+    "Just Listen": "👂 Minimal responses, maximum space"
+}
+
+BIG_FIVE_TRAIT_ORDER = ("extraversion", "agreeableness", "conscientiousness", "neuroticism", "openness")
+BIG_FIVE_OPTION_LABELS = ("Strongly Disagree", "Disagree", "Neutral", "Agree", "Strongly Agree")
+COPE_OPTION_LABELS = ("Not at all", "A little bit", "Medium amount", "A lot")
+
+SAFETY_REMINDER_HTML = """
+<div style="background: rgba(138, 92, 246, 0.1); border-left: 3px solid #8A5CF6; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
+    <p style="color: #A8A9B3; font-size: 0.85rem; margin: 0;">
+        <strong style="color: #FFFFFF;">💜 Remember:</strong> EmoSense is an AI companion for emotional support, 
+        not a replacement for professional mental health care.
+    </p>
+</div>
+"""
+
 # Apply persona if customization was completed
 if st.session_state.persona and st.session_state.customization_choice == "customized":
     mapped_personality = PERSONA_TO_PERSONALITY.get(
@@ -372,12 +379,10 @@ def detect_emotion_for_voice(text: str) -> Tuple[str, float]:
         Tuple of (dominant_emotion, confidence_score)
     """
     try:
-        predicted_emotions, probabilities = predict_emotions(text, threshold=0.3)
+        # Get the dominant emotion (highest probability)
+        dominant, confidence = predict_dominant_emotion(text)
         
-        if predicted_emotions and probabilities:
-            # Get the dominant emotion (highest probability)
-            dominant = predicted_emotions[0]
-            confidence = probabilities.get(dominant, 0.5)
+        if confidence >= 0.3:
             return dominant, confidence
         else:
             return "neutral", 0.5
@@ -433,6 +438,16 @@ def render_voice_chat_history():
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+def build_message_html(role: str, content: str, timestamp: str) -> str:
+    """
+    Build the chat bubble HTML for a message
+    
+    Called once when the message is appended so reruns reuse the markup.
+    """
+    bubble_class = "chat-bubble chat-user" if role == "user" else "chat-bubble chat-ai"
+    return f'<div class="{bubble_class}">{content}</div><div class="chat-meta">{timestamp}</div>'
+
+
 def render_chat_history():
     """Render the conversation history as chat bubbles"""
     if not st.session_state.chat_history:
@@ -447,22 +462,24 @@ def render_chat_history():
     
     st.markdown('<div class="premium-card"><div class="chat-shell">', unsafe_allow_html=True)
     for msg in st.session_state.chat_history:
-        role = msg["role"]
-        content = msg["content"]
-        timestamp = msg.get("timestamp", "")
-        bubble_class = "chat-bubble chat-user" if role == "user" else "chat-bubble chat-ai"
-        st.markdown(f'<div class="{bubble_class}">{content}</div><div class="chat-meta">{timestamp}</div>', unsafe_allow_html=True)
+        message_html = msg.get("html") or build_message_html(msg["role"], msg["content"], msg.get("timestamp", ""))
+        st.markdown(message_html, unsafe_allow_html=True)
     st.markdown('</div></div>', unsafe_allow_html=True)
 
 
 def should_analyze_emotions(user_message: str, mode: str) -> bool:
     """
     Determine if emotion analysis should run
-    Only runs when:
+    Never runs for empty or filler messages ("ok", "thanks", ...).
+    Otherwise only runs when:
     - User is in "Help Me Reflect" mode
     - Distress keywords are detected
     - User explicitly requests analysis
     """
+    # Fast path: nothing for the classifier to find in filler messages
+    if is_trivial_message(user_message):
+        return False
+    
     if mode == "Help Me Reflect":
         return True
     
@@ -488,27 +505,29 @@ def handle_user_message(user_message: str):
     mode = st.session_state.conversation_mode
     personality = st.session_state.bot_personality
     
+    # Read the clock once; the display string is reused for both messages
+    now = datetime.datetime.now()
+    timestamp = now.strftime("%I:%M %p")
+    
     # Check for crisis situation first
     if llm_service and llm_service.is_crisis_situation(user_message):
         # Immediate grounding response
         crisis_response = llm_service.get_crisis_response()
         
         # Add to chat history
-        timestamp = datetime.datetime.now().strftime("%I:%M %p")
         st.session_state.chat_history.append({
             "role": "user",
             "content": user_message,
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "html": build_message_html("user", user_message, timestamp)
         })
         st.session_state.chat_history.append({
             "role": "assistant",
             "content": crisis_response,
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "html": build_message_html("assistant", crisis_response, timestamp)
         })
         
-        # Keep last 10 conversations
-        st.session_state.chat_history = st.session_state.chat_history[-20:]
-        
         return
     
     # Determine if emotion analysis needed
@@ -524,17 +543,13 @@ def handle_user_message(user_message: str):
             "probabilities": probabilities
         }
         
-        # Store in emotion history
+        # Store in emotion history (the message text already lives in chat_history)
         st.session_state.emotion_history.append({
-            "timestamp": datetime.datetime.now(),
+            "timestamp": now,
             "emotions": predicted_emotions,
-            "probabilities": probabilities,
-            "message": user_message
+            "probabilities": probabilities
         })
         
-        # Keep last 10 emotion analyses
-        st.session_state.emotion_history = st.session_state.emotion_history[-10:]
-        
         st.session_state.last_emotion_data = emotion_context
     
     # Detect emotional trend
@@ -543,8 +558,6 @@ def handle_user_message(user_message: str):
         emotion_trend = llm_service.detect_emotional_trend(st.session_state.emotion_history)
     
     # Generate LLM response
-    timestamp = datetime.datetime.now().strftime("%I:%M %p")
-    
     if not llm_service:
         response = "I need an OpenAI API key to chat with you. Please configure OPENAI_API_KEY in your environment or Streamlit secrets. 🔑"
     else:
@@ -565,17 +578,16 @@ def handle_user_message(user_message: str):
         "role": "user",
         "content": user_message,
         "timestamp": timestamp,
-        "emotion_data": emotion_context
+        "emotion_data": emotion_context,
+        "html": build_message_html("user", user_message, timestamp)
     })
     
     st.session_state.chat_history.append({
         "role": "assistant",
         "content": response,
-        "timestamp": timestamp
+        "timestamp": timestamp,
+        "html": build_message_html("assistant", response, timestamp)
     })
-    
-    # Keep last 20 messages (10 exchanges)
-    st.session_state.chat_history = st.session_state.chat_history[-20:]
 
 
 # ============================================================
@@ -666,7 +678,7 @@ def render_big_five_assessment():
     """, unsafe_allow_html=True)
     
     # Response options for Big Five (1-5 Likert scale)
-    option_labels = ["Strongly Disagree", "Disagree", "Neutral", "Agree", "Strongly Agree"]
+    option_labels = BIG_FIVE_OPTION_LABELS
     
     # Show 5 questions per page
     questions_per_page = 5
@@ -782,7 +794,7 @@ def render_big_five_results():
     """, unsafe_allow_html=True)
     
     # Display trait scores
-    for trait_key in ["extraversion", "agreeableness", "conscientiousness", "neuroticism", "openness"]:
+    for trait_key in BIG_FIVE_TRAIT_ORDER:
         if trait_key in summary:
             info = summary[trait_key]
             score = info["score"]
@@ -870,7 +882,7 @@ def render_onboarding():
     """, unsafe_allow_html=True)
     
     # Response options
-    option_labels = ["Not at all", "A little bit", "Medium amount", "A lot"]
+    option_labels = COPE_OPTION_LABELS
     
     # Show 4 questions per page
     questions_per_page = 4
@@ -982,7 +994,7 @@ def render_persona_banner():
         
         # Create trait badges
         trait_badges = ""
-        for trait_key in ["extraversion", "agreeableness", "conscientiousness", "neuroticism", "openness"]:
+        for trait_key in BIG_FIVE_TRAIT_ORDER:
             if trait_key in summary:
                 info = summary[trait_key]
                 level = info.get("level", "medium")
@@ -1023,7 +1035,7 @@ def render_persona_banner():
         
         # Create trait badges
         trait_badges = ""
-        for trait_key in ["extraversion", "agreeableness", "conscientiousness", "neuroticism", "openness"]:
+        for trait_key in BIG_FIVE_TRAIT_ORDER:
             if trait_key in summary:
                 info = summary[trait_key]
                 level = info.get("level", "medium")
@@ -1075,8 +1087,74 @@ def render_persona_banner():
         """, unsafe_allow_html=True)
 
 
-def render_chat_ui():
-    """Render the main chat interface"""
+@st.fragment
+def render_chat_panel():
+    """
+    Render chat history, voice input and TTS playback
+    
+    Runs as a fragment so clearing or recording only reruns this panel
+    instead of the whole page. The text chat input stays at the page top
+    level (see CHAT INPUT below) so it remains pinned to the bottom.
+    """
+    # Chat history display
+    render_chat_history()
+    
+    spacer("sm")
+    
+    # Voice input row (compact)
+    col_voice, col_clear = st.columns([3, 1])
+    with col_voice:
+        audio_input = st.audio_input("🎙️ Voice input", key="inline_voice_input", label_visibility="collapsed")
+    with col_clear:
+        if st.button("🗑️ Clear Chat", use_container_width=True, type="secondary"):
+            reset_session_state("chat_history", "emotion_history", "last_emotion_data")
+            st.rerun(scope="fragment")
+    
+    # Handle voice input
+    if audio_input is not None:
+        audio_bytes = audio_input.getvalue()
+        audio_hash = audio_fingerprint(audio_bytes)
+        
+        if audio_hash != st.session_state.last_audio_hash and len(audio_bytes) > 0:
+            st.session_state.last_audio_hash = audio_hash
+            
+            if voice_service:
+                try:
+                    transcript_placeholder = st.empty()
+                    user_text = ""
+                    with st.spinner("🎙️ Transcribing your voice..."):
+                        for user_text in voice_service.speech_to_text_stream(audio_bytes):
+                            transcript_placeholder.info(f"📝 {user_text}…")
+                    
+                    if user_text.strip():
+                        transcript_placeholder.success(f"📝 You said: \"{user_text}\"")
+                        
+                        with st.spinner("💭 Thinking..."):
+                            handle_user_message(user_text)
+                        
+                        with st.spinner("🔊 Generating voice response..."):
+                            if st.session_state.chat_history:
+                                last_response = st.session_state.chat_history[-1]["content"]
+                                tts_audio = voice_service.text_to_speech(last_response)
+                                st.session_state.pending_tts_audio = tts_audio
+                        
+                        st.rerun(scope="fragment")
+                    else:
+                        transcript_placeholder.warning("🎙️ Couldn't understand the audio. Please try again.")
+                        
+                except Exception as e:
+                    st.error(f"❌ Error processing voice: {str(e)}")
+            else:
+                st.error("🔑 Voice service unavailable. Please configure OPENAI_API_KEY.")
+    
+    # Auto-play TTS
+    if st.session_state.pending_tts_audio is not None:
+        st.audio(st.session_state.pending_tts_audio, format="audio/mp3", autoplay=True)
+        st.session_state.pending_tts_audio = None
+
+
+def render_chat_ui(user_input: Optional[str] = None):
+    """Render the main chat interface, answering user_input from the chat input first"""
     # Show persona banner if customized
     render_persona_banner()
     
@@ -1090,7 +1168,7 @@ def render_chat_ui():
         with col_settings1:
             mode = st.selectbox(
                 "🎭 Conversation Mode",
-                ["Casual Chat", "Comfort Me", "Help Me Reflect", "Hype Me Up", "Just Listen"],
+                CONVERSATION_MODES,
                 key="mode_selector"
             )
             st.session_state.conversation_mode = mode
@@ -1098,7 +1176,7 @@ def render_chat_ui():
         with col_settings2:
             personality = st.selectbox(
                 "✨ Companion Personality",
-                ["Friendly", "Calm", "Big Sister", "Funny", "Deep Thinker"],
+                PERSONALITY_OPTIONS,
                 key="personality_selector"
             )
             st.session_state.bot_personality = personality
@@ -1106,7 +1184,7 @@ def render_chat_ui():
         # Just show mode selector for customized users
         mode = st.selectbox(
             "🎭 Conversation Mode",
-            ["Casual Chat", "Comfort Me", "Help Me Reflect", "Hype Me Up", "Just Listen"],
+            CONVERSATION_MODES,
             key="mode_selector"
         )
         st.session_state.conversation_mode = mode
@@ -1114,121 +1192,52 @@ def render_chat_ui():
     spacer("sm")
     
     # Display current mode
-    mode_descriptions = {
-        "Casual Chat": "💬 Natural, friendly conversation",
-        "Comfort Me": "🤗 Gentle support and grounding",
-        "Help Me Reflect": "🤔 Thoughtful exploration (auto emotion analysis)",
-        "Hype Me Up": "🔥 Energizing cheerleader mode",
-        "Just Listen": "👂 Minimal responses, maximum space"
-    }
-    
     st.markdown(f"""
     <div class="glass-card" style="padding: 0.75rem 1.25rem; margin-bottom: 1rem;">
         <span class="mode-badge">{st.session_state.conversation_mode}</span>
-        <span style="color: #9CA3AF; font-size: 0.875rem;">{mode_descriptions.get(st.session_state.conversation_mode, '')}</span>
+        <span style="color: #9CA3AF; font-size: 0.875rem;">{MODE_DESCRIPTIONS.get(st.session_state.conversation_mode, '')}</span>
     </div>
     """, unsafe_allow_html=True)
     
     spacer("sm")
     
-    # Chat history display
-    render_chat_history()
-    
-    spacer("sm")
-    
-    # Voice input row (compact)
-    col_voice, col_clear = st.columns([3, 1])
-    with col_voice:
-        audio_input = st.audio_input("🎙️ Voice input", key="inline_voice_input", label_visibility="collapsed")
-    with col_clear:
-        if st.button("🗑️ Clear Chat", use_container_width=True, type="secondary"):
-            st.session_state.chat_history = []
-            st.session_state.emotion_history = []
-            st.session_state.last_emotion_data = None
-            st.rerun()
-    
-    # Chat input at the bottom - Enter key sends automatically
-    user_input = st.chat_input("Type a message and press Enter... 💜")
-    
     # Handle text send (Enter key triggers this automatically)
     if user_input and user_input.strip():
         with st.spinner("💭 Thinking..."):
             handle_user_message(user_input)
-        st.rerun()
     
-    # Handle voice input
-    if audio_input is not None:
-        audio_bytes = audio_input.read()
-        audio_hash = hashlib.md5(audio_bytes).hexdigest()
-        
-        if audio_hash != st.session_state.last_audio_hash and len(audio_bytes) > 0:
-            st.session_state.last_audio_hash = audio_hash
-            
-            if voice_service:
-                try:
-                    with st.spinner("🎙️ Transcribing your voice..."):
-                        user_text = voice_service.speech_to_text(audio_bytes)
-                    
-                    if user_text.strip():
-                        st.success(f"📝 You said: \"{user_text}\"")
-                        
-                        with st.spinner("💭 Thinking..."):
-                            handle_user_message(user_text)
-                        
-                        with st.spinner("🔊 Generating voice response..."):
-                            if st.session_state.chat_history:
-                                last_response = st.session_state.chat_history[-1]["content"]
-                                tts_audio = voice_service.text_to_speech(last_response)
-                                st.session_state.pending_tts_audio = tts_audio
-                        
-                        st.rerun()
-                    else:
-                        st.warning("🎙️ Couldn't understand the audio. Please try again.")
-                        
-                except Exception as e:
-                    st.error(f"❌ Error processing voice: {str(e)}")
-            else:
-                st.error("🔑 Voice service unavailable. Please configure OPENAI_API_KEY.")
-    
-    # Auto-play TTS
-    if st.session_state.pending_tts_audio is not None:
-        st.audio(st.session_state.pending_tts_audio, format="audio/mp3", autoplay=True)
-        st.session_state.pending_tts_audio = None
+    # Chat panel (history, voice) reruns on its own
+    render_chat_panel()
     
     spacer("md")
     
     # Safety reminder
-    st.markdown("""
-    <div style="background: rgba(138, 92, 246, 0.1); border-left: 3px solid #8A5CF6; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
-        <p style="color: #A8A9B3; font-size: 0.85rem; margin: 0;">
-            <strong style="color: #FFFFFF;">💜 Remember:</strong> EmoSense is an AI companion for emotional support, 
-            not a replacement for professional mental health care.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SAFETY_REMINDER_HTML, unsafe_allow_html=True)
     
     # Small reset option at the bottom
     spacer("sm")
     col1, col2, col3 = st.columns([2, 1, 2])
     with col2:
         if st.button("🔄 Reset Persona", use_container_width=True, type="secondary", help="Retake personality assessments"):
-            st.session_state.companion_mode = "choice"
-            st.session_state.customization_choice = None
-            st.session_state.cope_answers = {}
-            st.session_state.cope_scores = {}
-            st.session_state.persona = None
-            st.session_state.persona_info = None
-            st.session_state.onboarding_page = 0
-            st.session_state.big_five_answers = {}
-            st.session_state.big_five_scores = None
-            st.session_state.big_five_summary = None
-            st.session_state.big_five_page = 0
-            st.session_state.chat_history = []
-            st.session_state.emotion_history = []
-            st.session_state.bot_personality = "Friendly"
+            reset_session_state(
+                "companion_mode", "customization_choice",
+                "cope_answers", "cope_scores", "persona", "persona_info", "onboarding_page",
+                "big_five_answers", "big_five_scores", "big_five_summary", "big_five_page",
+                "chat_history", "emotion_history", "bot_personality"
+            )
             st.rerun()
 
 
+# ============================================================
+# CHAT INPUT
+# ============================================================
+
+# Created at the page top level, outside containers and the chat fragment,
+# so Streamlit pins it to the bottom of the window
+chat_user_input = None
+if st.session_state.companion_mode == "chat":
+    chat_user_input = st.chat_input("Type a message and press Enter... 💜")
+
 # ============================================================
 # MAIN UI LAYOUT - STATE MACHINE ROUTER
 # ============================================================
@@ -1250,7 +1259,7 @@ with page_container():
     elif st.session_state.companion_mode == "onboarding":
         render_onboarding()
     elif st.session_state.companion_mode == "chat":
-        render_chat_ui()
+        render_chat_ui(chat_user_input)
     else:
         # Default to choice
         st.session_state.companion_mode = "choice"
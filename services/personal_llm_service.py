@@ -53,10 +53,30 @@ class PersonalLLMService:
         "hurt myself", "self harm"
     ]
     
-    # Slang indicators for style detection
+    # Slang indicators for style detection (precompiled)
     SLANG_PATTERNS = [
-        r'\b(bro|bruh|dude|lol|lmao|omg|wtf|idk|idek|tbh|ngl|fr|frfr|imo|rn|lowkey|highkey|vibe|vibes|sus|slay|bet|fam|deadass|no cap|cap|bussin|fire|lit|mood|same|valid|snatched|periodt|sis|bestie|girlie|tea|spill|salty|shook|iconic|stan|simp|flex|glow up|big yikes|yikes|oof|yeet|based|cringe|goat|goated|hits different|rent free|main character|understood the assignment|it\'s giving|ate that|left no crumbs)\b',
-        r'\b(gonna|wanna|gotta|kinda|sorta|dunno|ain\'t|y\'all|imma|lemme|gimme|whatcha|gotcha|ya|yea|yeah|yep|nah|nope)\b'
+        re.compile(r'\b(bro|bruh|dude|lol|lmao|omg|wtf|idk|idek|tbh|ngl|fr|frfr|imo|rn|lowkey|highkey|vibe|vibes|sus|slay|bet|fam|deadass|no cap|cap|bussin|fire|lit|mood|same|valid|snatched|periodt|sis|bestie|girlie|tea|spill|salty|shook|iconic|stan|simp|flex|glow up|big yikes|yikes|oof|yeet|based|cringe|goat|goated|hits different|rent free|main character|understood the assignment|it\'s giving|ate that|left no crumbs)\b'),
+        re.compile(r'\b(gonna|wanna|gotta|kinda|sorta|dunno|ain\'t|y\'all|imma|lemme|gimme|whatcha|gotcha|ya|yea|yeah|yep|nah|nope)\b')
+    ]
+    
+    # Tone keywords, checked in order (first match wins)
+    TONE_KEYWORDS = {
+        "sad": ["sad", "crying", "tears", "miss", "lost", "grief", "hurts", "heartbroken", "depressed", "down"],
+        "stressed": ["stressed", "pressure", "deadline", "too much", "can't handle", "breaking", "burnout", "overwhelmed"],
+        "confused": ["confused", "don't know", "idk", "idek", "unsure", "lost", "what do i", "help me understand", "makes no sense"],
+        "angry": ["angry", "mad", "pissed", "furious", "hate", "frustrated", "annoyed", "sick of", "fed up"],
+        "hopeful": ["hope", "maybe", "could be", "looking forward", "excited", "optimistic", "positive"],
+        "overwhelmed": ["too much", "can't cope", "drowning", "overwhelmed", "everything at once", "so much"],
+        "anxious": ["anxious", "worried", "nervous", "scared", "fear", "panic", "what if", "can't stop thinking"],
+        "lonely": ["lonely", "alone", "no one", "nobody", "isolated", "miss people", "by myself"],
+        "frustrated": ["frustrated", "stuck", "going nowhere", "nothing works", "tried everything"],
+        "numb": ["numb", "empty", "nothing", "don't feel", "blank", "disconnected"]
+    }
+    
+    # One precompiled alternation per tone (same substring semantics as `kw in text`)
+    TONE_PATTERNS = [
+        (tone, re.compile("|".join(re.escape(kw) for kw in keywords)))
+        for tone, keywords in TONE_KEYWORDS.items()
     ]
     
     # Common emojis for detection
@@ -115,6 +135,15 @@ class PersonalLLMService:
         "numb": "be gently present, don't force emotion, stay patient"
     }
     
+    # Personality descriptions used by generate_emotion_reflection
+    REFLECTION_TRAITS = {
+        "Calm": "tranquil and centered",
+        "Big Sister": "caring and supportive",
+        "Friendly": "warm and understanding",
+        "Funny": "lighthearted but caring",
+        "Deep Thinker": "thoughtful and insightful"
+    }
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize OpenAI client for conversational AI
@@ -181,7 +210,7 @@ class PersonalLLMService:
         # 3. Detect slang usage
         slang_count = 0
         for pattern in self.SLANG_PATTERNS:
-            slang_count += len(re.findall(pattern, message_lower))
+            slang_count += len(pattern.findall(message_lower))
         
         if slang_count == 0:
             slang_level = "none"
@@ -232,21 +261,8 @@ class PersonalLLMService:
         Returns:
             Detected tone string
         """
-        tone_keywords = {
-            "sad": ["sad", "crying", "tears", "miss", "lost", "grief", "hurts", "heartbroken", "depressed", "down"],
-            "stressed": ["stressed", "pressure", "deadline", "too much", "can't handle", "breaking", "burnout", "overwhelmed"],
-            "confused": ["confused", "don't know", "idk", "idek", "unsure", "lost", "what do i", "help me understand", "makes no sense"],
-            "angry": ["angry", "mad", "pissed", "furious", "hate", "frustrated", "annoyed", "sick of", "fed up"],
-            "hopeful": ["hope", "maybe", "could be", "looking forward", "excited", "optimistic", "positive"],
-            "overwhelmed": ["too much", "can't cope", "drowning", "overwhelmed", "everything at once", "so much"],
-            "anxious": ["anxious", "worried", "nervous", "scared", "fear", "panic", "what if", "can't stop thinking"],
-            "lonely": ["lonely", "alone", "no one", "nobody", "isolated", "miss people", "by myself"],
-            "frustrated": ["frustrated", "stuck", "going nowhere", "nothing works", "tried everything"],
-            "numb": ["numb", "empty", "nothing", "don't feel", "blank", "disconnected"]
-        }
-        
-        for tone, keywords in tone_keywords.items():
-            if any(kw in message_lower for kw in keywords):
+        for tone, pattern in self.TONE_PATTERNS:
+            if pattern.search(message_lower):
                 return tone
         
         return "neutral"
@@ -548,7 +564,7 @@ Consider weaving this supportive approach into your response NATURALLY:
             Formatted messages for API
         """
         # Keep last 10 messages to avoid token limits
-        recent_history = chat_history[-10:] if len(chat_history) > 10 else chat_history
+        recent_history = list(chat_history)[-10:]
         
         formatted = []
         for msg in recent_history:
@@ -573,7 +589,7 @@ Consider weaving this supportive approach into your response NATURALLY:
             return None
         
         # Look at last 3 emotion analyses
-        recent_emotions = emotion_history[-3:]
+        recent_emotions = list(emotion_history)[-3:]
         
         # Track stress/anxiety/sadness levels
         stress_levels = []
@@ -709,15 +725,7 @@ Consider weaving this supportive approach into your response NATURALLY:
             # Build focused emotion analysis prompt
             emotion_list = ", ".join([f"{e.capitalize()} ({probabilities[e]:.0%})" for e in emotions[:3]])
             
-            personality_traits = {
-                "Calm": "tranquil and centered",
-                "Big Sister": "caring and supportive",
-                "Friendly": "warm and understanding",
-                "Funny": "lighthearted but caring",
-                "Deep Thinker": "thoughtful and insightful"
-            }
-            
-            system_prompt = f"""You are EmoSense Companion with a {personality_traits.get(personality, 'friendly')} personality.
+            system_prompt = f"""You are EmoSense Companion with a {self.REFLECTION_TRAITS.get(personality, 'friendly')} personality.
 
 The user asked you to analyze their emotions. You detected: {emotion_list}
 
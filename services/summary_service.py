@@ -15,6 +15,11 @@ HF_API_KEY = os.getenv("HUGGINGFACE_API_KEY")
 SUMMARIZATION_MODEL = "facebook/bart-large-cnn"
 HF_API_URL = f"https://api-inference.huggingface.co/models/{SUMMARIZATION_MODEL}"
 
+# Text cleaning patterns used by clean_text
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s.,!?;:\'-]')
+
 # Note: Using serverless inference API (as of Nov 2024, this is the correct endpoint)
 # If you get 410 errors, the API may have changed - check https://huggingface.co/docs/api-inference
 
@@ -62,13 +67,13 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = HTML_TAG_PATTERN.sub('', text)
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s.,!?;:\'-]', '', text)
+    text = SPECIAL_CHAR_PATTERN.sub('', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -4,11 +4,17 @@ Handles Speech-to-Text (STT), Text-to-Speech (TTS), and emotion-aware responses
 """
 
 import os
-from typing import Optional, Tuple, Dict, List
-from openai import OpenAI
+from typing import Optional, Tuple, Dict, List, Iterator
+from openai import OpenAI, OpenAIError, BadRequestError, NotFoundError, PermissionDeniedError
 import streamlit as st
 
 
+# Model for streamed transcription (whisper-1 cannot stream). Set
+# EMOSENSE_STREAM_STT_MODEL to another streaming model, or to an empty string
+# to transcribe every clip with whisper-1 in a single request instead.
+STREAM_STT_MODEL = os.getenv("EMOSENSE_STREAM_STT_MODEL", "gpt-4o-mini-transcribe")
+
+
 class VoiceChatService:
     """
     Manages voice conversation pipeline:
@@ -39,6 +45,7 @@ class VoiceChatService:
         self.client = OpenAI(api_key=self.api_key)
         self.chat_model = "gpt-4o-mini"
         self.whisper_model = "whisper-1"
+        self.stream_stt_model = STREAM_STT_MODEL
         self.tts_model = "tts-1"
         self.tts_voice = "nova"  # Warm, friendly voice
     
@@ -63,6 +70,48 @@ class VoiceChatService:
         except Exception as e:
             raise Exception(f"Speech-to-text failed: {str(e)}")
     
+    def speech_to_text_stream(self, audio_bytes: bytes) -> Iterator[str]:
+        """
+        Transcribe audio to text, yielding the transcript as it grows
+        
+        Uses STREAM_STT_MODEL. Falls back to a single whisper-1
+        speech_to_text() call when no streaming model is configured, or when
+        the API rejects the streaming model (not found, not permitted or
+        unsupported) before any text has arrived.
+        
+        Args:
+            audio_bytes: Raw audio bytes from st.audio_input()
+            
+        Yields:
+            Partial transcript so far; the last value is the full transcript
+        """
+        if not self.stream_stt_model:
+            yield self.speech_to_text(audio_bytes)
+            return
+        
+        transcript = ""
+        try:
+            stream = self.client.audio.transcriptions.create(
+                file=("user_audio.wav", audio_bytes),
+                model=self.stream_stt_model,
+                response_format="text",
+                stream=True
+            )
+            for event in stream:
+                if event.type == "transcript.text.delta":
+                    transcript += event.delta
+                    yield transcript
+                elif event.type == "transcript.text.done":
+                    transcript = event.text
+            yield transcript.strip()
+        except (BadRequestError, NotFoundError, PermissionDeniedError) as e:
+            if transcript:
+                raise Exception(f"Speech-to-text failed: {str(e)}")
+            print(f"⚠️ Streaming transcription unavailable ({self.stream_stt_model}), using {self.whisper_model}: {str(e)}")
+            yield self.speech_to_text(audio_bytes)
+        except OpenAIError as e:
+            raise Exception(f"Speech-to-text failed: {str(e)}")
+    
     def generate_supportive_reply(
         self,
         user_text: str,
@@ -140,6 +189,9 @@ class VoiceChatService:
         """
         Convert text response to speech audio
         
+        The whole reply is synthesized in one request (one MP3 header, natural
+        prosody across sentences) and the audio is read as it streams in.
+        
         Args:
             reply_text: Text to convert to speech
             
@@ -147,13 +199,13 @@ class VoiceChatService:
             Audio bytes (MP3 format)
         """
         try:
-            speech_response = self.client.audio.speech.create(
+            with self.client.audio.speech.with_streaming_response.create(
                 model=self.tts_model,
                 voice=self.tts_voice,
                 input=reply_text,
                 response_format="mp3"
-            )
-            return speech_response.read()
+            ) as speech_response:
+                return b"".join(speech_response.iter_bytes())
         except Exception as e:
             raise Exception(f"Text-to-speech failed: {str(e)}")
     
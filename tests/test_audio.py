@@ -0,0 +1,56 @@
+"""
+Unit tests for voice input audio fingerprints
+"""
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import audio
+from utils.audio import audio_fingerprint, FINGERPRINT_EDGE_BYTES
+
+CLIP = bytes(range(256)) * 64  # 16 KB, longer than both hashed edges
+
+
+@pytest.fixture(params=[True, False], ids=["xxhash", "blake2b"])
+def hash_backend(request, monkeypatch):
+    """Run each test with xxhash (when installed) and with the blake2b fallback"""
+    if request.param and not audio.XXHASH_AVAILABLE:
+        pytest.skip("xxhash not installed")
+    monkeypatch.setattr(audio, "XXHASH_AVAILABLE", request.param)
+
+
+def test_fingerprint_is_stable(hash_backend):
+    """Test the same clip always gets the same fingerprint"""
+    assert audio_fingerprint(CLIP) == audio_fingerprint(bytes(CLIP))
+    assert isinstance(audio_fingerprint(CLIP), int)
+
+
+def test_fingerprint_changes_with_edges_and_length(hash_backend):
+    """Test a different head, tail or length gives a different fingerprint"""
+    head_changed = bytes([CLIP[0] ^ 0xFF]) + CLIP[1:]
+    tail_changed = CLIP[:-1] + bytes([CLIP[-1] ^ 0xFF])
+    longer = CLIP + b"\x00"
+
+    fingerprint = audio_fingerprint(CLIP)
+    assert audio_fingerprint(head_changed) != fingerprint
+    assert audio_fingerprint(tail_changed) != fingerprint
+    assert audio_fingerprint(longer) != fingerprint
+
+
+def test_fingerprint_ignores_middle_bytes(hash_backend):
+    """Test only the edges and length are hashed (the middle is skipped by design)"""
+    middle = len(CLIP) // 2
+    assert FINGERPRINT_EDGE_BYTES < middle < len(CLIP) - FINGERPRINT_EDGE_BYTES
+
+    middle_changed = CLIP[:middle] + bytes([CLIP[middle] ^ 0xFF]) + CLIP[middle + 1:]
+    assert audio_fingerprint(middle_changed) == audio_fingerprint(CLIP)
+
+
+def test_fingerprint_short_and_empty_clips(hash_backend):
+    """Test clips shorter than the hashed edges and empty input"""
+    assert audio_fingerprint(b"") == audio_fingerprint(b"")
+    assert audio_fingerprint(b"abc") != audio_fingerprint(b"abd")
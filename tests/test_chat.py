@@ -0,0 +1,37 @@
+"""
+Unit tests for chat message routing helpers
+"""
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.chat import is_trivial_message, TRIVIAL_MESSAGES
+
+
+@pytest.mark.parametrize("message", ["", "   ", "?!", "ok", "OK!", "  thanks.  ", "Thank you!!", "lol~", "bye"])
+def test_trivial_messages_skip_analysis(message):
+    """Test empty, punctuation-only and filler messages are trivial"""
+    assert is_trivial_message(message)
+
+
+@pytest.mark.parametrize("message", [
+    "ok but I'm really stressed",
+    "I feel lonely today",
+    "no one listens to me",
+    "thanks for nothing",
+    "okay?? I'm not okay",
+])
+def test_meaningful_messages_are_analyzed(message):
+    """Test messages that only start with filler words still get analyzed"""
+    assert not is_trivial_message(message)
+
+
+def test_every_trivial_message_is_normalized_form():
+    """Test the filler set only holds lowercase, stripped entries so lookups can match"""
+    for entry in TRIVIAL_MESSAGES:
+        assert entry == entry.strip().lower()
+        assert is_trivial_message(entry)
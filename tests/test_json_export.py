@@ -0,0 +1,67 @@
+"""
+Unit tests for JSON report serialization
+"""
+import sys
+import os
+import json
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import json_export
+from utils.json_export import dumps_json
+
+REPORT = {
+    "report_metadata": {"generated_at": "2024-01-01T12:00:00", "comments_analyzed": 2},
+    "raw_comments": ["Love it 😍", "Naïve pricing, très cher"],
+    "emotion_analysis": {
+        "aggregated_emotions": {"joy": 0.5, "anger": 0.125},
+        "sorted_emotions": [("joy", 0.5), ("anger", 0.125)],
+        "dominant_emotion": "joy",
+    },
+    "crisis_alerts": [],
+    "insights": None,
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the json fallback"""
+    if request.param and json_export.orjson is None:
+        pytest.skip("orjson not installed")
+    if not request.param:
+        monkeypatch.setattr(json_export, "orjson", None)
+
+
+def test_round_trip(json_backend):
+    """Test a report survives dumps_json -> json.loads (tuples come back as lists)"""
+    data = dumps_json(REPORT)
+
+    assert isinstance(data, bytes)
+    expected = json.loads(json.dumps(REPORT))
+    assert json.loads(data) == expected
+
+
+def test_output_is_indented_utf8(json_backend):
+    """Test output is indented and keeps non-ASCII text unescaped"""
+    text = dumps_json(REPORT).decode("utf-8")
+
+    assert '\n  "report_metadata"' in text
+    assert "😍" in text and "très" in text
+
+
+def test_non_str_keys(json_backend):
+    """Test integer keys are written as strings, like json.dumps does"""
+    assert json.loads(dumps_json({1: "a", "b": 2})) == {"1": "a", "b": 2}
+
+
+def test_numpy_values():
+    """Test numpy scalars and arrays serialize when orjson is available"""
+    if json_export.orjson is None:
+        pytest.skip("orjson not installed")
+
+    data = dumps_json({"probs": np.array([0.5, 0.25], dtype=np.float32), "count": np.int64(3)})
+    assert json.loads(data) == {"probs": [0.5, 0.25], "count": 3}
@@ -0,0 +1,127 @@
+"""
+Unit tests for batched emotion prediction (mock mode)
+"""
+import sys
+import os
+import random
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Don't download the model for tests; utils.predict falls back to mock predictions
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from utils import predict
+from utils.labels import EMOTIONS
+
+TEXTS = [
+    "I love this product so much",
+    "This update is really frustrating",
+    "okay",
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_mode(monkeypatch):
+    """Force mock predictions even if a model or ONNX export is available locally"""
+    monkeypatch.setattr(predict, "USE_MOCK", True)
+    monkeypatch.setattr(predict, "ort_session", None)
+
+
+def test_predict_probs_batch_matches_single_text():
+    """Test batched probabilities match predict_emotions row for row"""
+    random.seed(7)
+    batch = predict.predict_probs_batch(TEXTS, batch_size=2)
+
+    random.seed(7)
+    singles = [predict.predict_emotions(text, return_array=True)[2] for text in TEXTS]
+
+    assert batch.shape == (len(TEXTS), len(EMOTIONS))
+    np.testing.assert_allclose(batch, np.stack(singles), rtol=1e-6)
+
+
+def test_predict_emotions_batch_matches_single_text():
+    """Test batched (emotions, probabilities) tuples match predict_emotions"""
+    random.seed(11)
+    batch = predict.predict_emotions_batch(TEXTS, threshold=0.3)
+
+    random.seed(11)
+    singles = [predict.predict_emotions(text, threshold=0.3) for text in TEXTS]
+
+    assert len(batch) == len(singles)
+    for (batch_emotions, batch_probs), (single_emotions, single_probs) in zip(batch, singles):
+        assert list(batch_probs) == EMOTIONS
+        assert batch_probs == pytest.approx(single_probs, rel=1e-6)
+        assert batch_emotions == single_emotions
+
+
+def test_predict_emotions_batch_return_array():
+    """Test return_array gives the same matrix the tuples were built from"""
+    results, probs_matrix = predict.predict_emotions_batch(TEXTS, return_array=True)
+
+    assert probs_matrix.shape == (len(TEXTS), len(EMOTIONS))
+    for (_, probabilities), row in zip(results, probs_matrix):
+        assert list(probabilities.values()) == pytest.approx(row.tolist())
+
+
+def test_empty_input():
+    """Test empty input returns empty results instead of failing"""
+    probs_matrix = predict.predict_probs_batch([])
+    assert probs_matrix.shape == (0, len(EMOTIONS))
+
+    assert predict.predict_emotions_batch([]) == []
+
+    results, probs_matrix = predict.predict_emotions_batch([], return_array=True)
+    assert results == []
+    assert probs_matrix.shape == (0, len(EMOTIONS))
+
+
+def test_predict_comment_probs_matches_batch(monkeypatch):
+    """Test chunked comment scoring stitches chunks back together in order"""
+    monkeypatch.setattr(predict, "cached_predict_probs_batch", lambda texts: predict.predict_probs_batch(list(texts)))
+
+    random.seed(3)
+    probs_matrix = predict.predict_comment_probs(TEXTS, batch_size=2)
+
+    random.seed(3)
+    expected = predict.predict_probs_batch(TEXTS)
+
+    np.testing.assert_allclose(probs_matrix, expected, rtol=1e-6)
+
+
+def test_predict_comment_probs_nan_rows(monkeypatch):
+    """Test a failing chunk is retried per comment and only failing comments become NaN rows"""
+    def flaky_predict(texts):
+        if any("frustrating" in text for text in texts):
+            raise RuntimeError("inference failed")
+        return predict.predict_probs_batch(list(texts))
+
+    monkeypatch.setattr(predict, "cached_predict_probs_batch", flaky_predict)
+
+    probs_matrix = predict.predict_comment_probs(TEXTS, batch_size=2)
+
+    assert probs_matrix.shape == (len(TEXTS), len(EMOTIONS))
+    failed_rows = np.isnan(probs_matrix).any(axis=1)
+    assert failed_rows.tolist() == [False, True, False]
+    assert np.isnan(probs_matrix[1]).all()
+
+
+def test_predict_comment_probs_empty_input():
+    """Test empty input gives an empty matrix"""
+    assert predict.predict_comment_probs([]).shape == (0, len(EMOTIONS))
+
+
+def test_predict_comment_probs_reports_progress(monkeypatch):
+    """Test on_progress is called once per chunk with cumulative counts"""
+    monkeypatch.setattr(predict, "cached_predict_probs_batch", lambda texts: predict.predict_probs_batch(list(texts)))
+
+    calls = []
+    predict.predict_comment_probs(TEXTS, batch_size=2, on_progress=lambda done, total: calls.append((done, total)))
+
+    assert calls == [(2, 3), (3, 3)]
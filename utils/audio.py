@@ -0,0 +1,37 @@
+"""
+Audio helpers for voice input
+Uses xxhash when installed, falling back to hashlib.blake2b
+"""
+import hashlib
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Bytes hashed from each end of a clip by audio_fingerprint
+FINGERPRINT_EDGE_BYTES = 4096
+
+
+def audio_fingerprint(audio_bytes: bytes) -> int:
+    """
+    Cheap fingerprint to detect the same recording across reruns
+
+    Hashes only the first and last 4 KB plus the total length instead of
+    the whole clip.
+
+    Args:
+        audio_bytes: Raw audio from st.audio_input
+
+    Returns:
+        Integer fingerprint
+    """
+    sample = (
+        audio_bytes[:FINGERPRINT_EDGE_BYTES]
+        + audio_bytes[-FINGERPRINT_EDGE_BYTES:]
+        + len(audio_bytes).to_bytes(8, "little")
+    )
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(sample)
+    return int.from_bytes(hashlib.blake2b(sample, digest_size=8).digest(), "little")
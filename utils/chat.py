@@ -0,0 +1,27 @@
+"""
+Chat message helpers shared by the companion pages
+Kept free of model imports so they can be used (and tested) without torch
+"""
+
+# Filler messages that carry no emotional signal; BERT analysis is skipped for these
+TRIVIAL_MESSAGES = frozenset({
+    "ok", "okay", "k", "kk", "hi", "hey", "hello", "yes", "yeah", "yep", "no", "nope",
+    "thanks", "thank you", "ty", "lol", "hmm", "cool", "sure", "bye"
+})
+
+# Punctuation and whitespace ignored around a message before the filler check
+TRIVIAL_STRIP_CHARS = "!?.,~ "
+
+
+def is_trivial_message(message: str) -> bool:
+    """
+    Check whether a chat message is empty or pure filler ("ok", "thanks!", ...)
+
+    Args:
+        message: Raw user message
+
+    Returns:
+        True if there is nothing for the emotion classifier to find
+    """
+    normalized = message.strip().strip(TRIVIAL_STRIP_CHARS).lower()
+    return not normalized or normalized in TRIVIAL_MESSAGES
@@ -0,0 +1,25 @@
+"""
+JSON serialization for report downloads
+Uses orjson when installed, falling back to the standard library
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data) -> bytes:
+    """
+    Serialize report data to indented UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-compatible report dictionary
+
+    Returns:
+        bytes: JSON document, ready to pass to st.download_button
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
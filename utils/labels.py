@@ -1,6 +1,8 @@
 # List of all 28 emotion labels
 # GoEmotions dataset emotion categories
 
+import numpy as np
+
 EMOTIONS = [
     'admiration',
     'amusement',
@@ -63,3 +65,13 @@ EMOJI_MAP = {
     'surprise': '😲',
     'neutral': '😐'
 }
+
+# Display name for each emotion (precomputed for formatting loops)
+EMOTION_DISPLAY = {emotion: emotion.capitalize() for emotion in EMOTIONS}
+
+# Labels as an array indexed like EMOTIONS (label id), for boolean-mask and argmax lookups
+EMOTION_NAMES = np.array(EMOTIONS, dtype=object)
+
+# Business sentiment buckets (set membership for scoring and brand health)
+POSITIVE_EMOTIONS = frozenset({"joy", "love", "gratitude", "admiration", "excitement", "optimism", "pride", "relief"})
+NEGATIVE_EMOTIONS = frozenset({"anger", "sadness", "fear", "disappointment", "disgust", "annoyance", "disapproval", "embarrassment"})
@@ -2,21 +2,24 @@
 # This file simulates emotion prediction without loading actual models
 
 import random
+import numpy as np
 from .labels import EMOTIONS
 
 
-def predict_emotions(text: str, threshold=0.3):
+def predict_emotions(text: str, threshold=0.3, return_array=False):
     """
     Mock emotion prediction for UI testing (no ML models required).
     
     Args:
         text (str): Input text to analyze
         threshold (float): Probability threshold for emotion detection (default: 0.3)
+        return_array (bool): Also return the probabilities as a numpy array (default: False)
     
     Returns:
-        tuple: (predicted_emotions, probabilities)
+        tuple: (predicted_emotions, probabilities[, probs_array])
             - predicted_emotions: list of emotion labels above threshold
             - probabilities: dict mapping all emotion labels to their probabilities
+            - probs_array: numpy array indexed like EMOTIONS (only if return_array)
     """
     # Generate fake probabilities for all 28 emotions
     # Make some emotions more likely than others for realistic testing
@@ -41,4 +44,6 @@ def predict_emotions(text: str, threshold=0.3):
         emotion for emotion, prob in prob_dict.items() if prob >= threshold
     ]
     
+    if return_array:
+        return predicted_emotions, prob_dict, np.asarray(fake_probs, dtype=np.float32)
     return predicted_emotions, prob_dict
@@ -1,24 +1,65 @@
 # Model loading and prediction functions
 # This file handles loading the AI model from HuggingFace Hub
 
+import numpy as np
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from .labels import EMOTIONS
 import os
 import streamlit as st
 import gc
+import functools
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Load model from HuggingFace Hub
 MODEL_ID = "Amarnoor/emotion-bert-emosense"
 
+# Set EMOSENSE_FP32_MODEL=true to skip int8 quantization (accuracy A/B checks)
+USE_FP32_MODEL = os.getenv("EMOSENSE_FP32_MODEL", "false").lower() == "true"
+
+# Quantized ONNX export produced by export_onnx_model.py (used when present)
+ONNX_MODEL_PATH = Path(__file__).resolve().parent.parent / "models" / "emotion_bert_onnx_int8" / "model_quantized.onnx"
+
+# Set EMOSENSE_TORCH_COMPILE=true to try torch.compile (opt-in; eager mode is the default)
+USE_TORCH_COMPILE = os.getenv("EMOSENSE_TORCH_COMPILE", "false").lower() == "true"
+
+# Batch sizes the app runs the model at (single texts and predict_probs_batch chunks),
+# used to warm up a compiled model at load time
+WARMUP_BATCH_SIZES = (1, 32)
+
+
+@st.cache_resource(show_spinner="Loading ONNX emotion model...")
+def load_onnx_session():
+    """Load and cache an ONNX Runtime session for the int8 model, if exported"""
+    if not ONNX_MODEL_PATH.exists():
+        return None
+    try:
+        import onnxruntime as ort
+        session = ort.InferenceSession(str(ONNX_MODEL_PATH), providers=["CPUExecutionProvider"])
+        print(f"✅ Using ONNX Runtime int8 model: {ONNX_MODEL_PATH.name}")
+        return session
+    except Exception as e:
+        print(f"⚠️ Warning: Could not load ONNX model, using PyTorch: {str(e)}")
+        return None
+
+# The ONNX session is tried first so the PyTorch weights are only loaded when it is unavailable
+ort_session = load_onnx_session()
+
+
 # Use Streamlit caching to avoid reloading model on every page
 @st.cache_resource(show_spinner="Loading emotion detection model...")
-def load_model():
-    """Load and cache the BERT emotion model"""
+def load_model(load_weights=True):
+    """Load and cache the tokenizer and, unless load_weights is False, the BERT emotion model"""
     try:
         print(f"Loading tokenizer from HuggingFace Hub: {MODEL_ID}...")
         _tokenizer = AutoTokenizer.from_pretrained(MODEL_ID)
 
+        # The ONNX session serves inference; skip downloading, quantizing and compiling the weights
+        if not load_weights:
+            return _tokenizer, None, None, torch.device("cpu"), False  # USE_MOCK = False
+
         print(f"Loading model from HuggingFace Hub: {MODEL_ID}...")
         _model = AutoModelForSequenceClassification.from_pretrained(
             MODEL_ID,
@@ -30,6 +71,18 @@ def load_model():
         _device = torch.device("cpu")
         _model.to(_device)
         _model.eval()
+
+        # Dynamic int8 quantization of Linear layers for faster CPU inference
+        if not USE_FP32_MODEL:
+            try:
+                if "fbgemm" in torch.backends.quantized.supported_engines:
+                    torch.backends.quantized.engine = "fbgemm"
+                _model = torch.quantization.quantize_dynamic(
+                    _model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                print(f"✅ Applied int8 dynamic quantization ({torch.backends.quantized.engine})")
+            except Exception as e:
+                print(f"⚠️ Warning: Quantization failed, using FP32 model: {str(e)}")
         
         # Free up memory
         gc.collect()
@@ -42,29 +95,140 @@ def load_model():
             f"{_model.config.num_labels} labels"
         )
         print(f"✅ Validated: Model has {_model.config.num_labels} output labels matching EMOTIONS list")
+
+        # Compile once here and warm up at the app's padded batch shapes so user
+        # requests hit the compiled graph; the eager model is kept as the fallback
+        _compiled = None
+        if USE_TORCH_COMPILE and hasattr(torch, "compile"):
+            try:
+                _compiled = torch.compile(_model, dynamic=True)
+                with torch.inference_mode():
+                    for batch_size in WARMUP_BATCH_SIZES:
+                        warmup = ["warm up", "warm up with a somewhat longer padded sentence"] * batch_size
+                        _compiled(**_tokenizer(
+                            warmup[:batch_size],
+                            return_tensors="pt",
+                            truncation=True,
+                            padding=True,
+                            max_length=512
+                        ))
+                print("✅ Compiled model with torch.compile")
+            except Exception as e:
+                _compiled = None
+                print(f"⚠️ Warning: torch.compile failed, using eager model: {str(e)}")
         
-        return _tokenizer, _model, _device, False  # USE_MOCK = False
+        return _tokenizer, _model, _compiled, _device, False  # USE_MOCK = False
 
     except Exception as e:
         print(f"⚠️ Warning: Could not load model from HuggingFace Hub: {str(e)}")
         print(f"⚠️ Falling back to mock predictions for demo purposes")
         gc.collect()
-        return None, None, torch.device("cpu"), True  # USE_MOCK = True
+        return None, None, None, torch.device("cpu"), True  # USE_MOCK = True
 
 # Load model (cached)
-tokenizer, model, device, USE_MOCK = load_model()
+tokenizer, model, compiled_model, device, USE_MOCK = load_model(load_weights=ort_session is None)
+if USE_MOCK:
+    ort_session = None
+
+# Dynamo compiles are not thread-safe, so compiled calls from the worker pool are serialized
+_compiled_lock = threading.Lock()
+
+
+def _forward_probs(inputs):
+    """Run the classifier on tokenized inputs and return sigmoid probabilities (batch x labels)"""
+    if ort_session is not None:
+        feed = {i.name: inputs[i.name].numpy() for i in ort_session.get_inputs()}
+        logits = ort_session.run(None, feed)[0]
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    global compiled_model
+    inputs = {key: val.to(device) for key, val in inputs.items()}
+
+    with torch.inference_mode():
+        logits = None
+        if compiled_model is not None:
+            try:
+                with _compiled_lock:
+                    logits = compiled_model(**inputs).logits
+            except Exception as e:
+                # A recompile for an unseen shape failed; stay on the eager model from here on
+                print(f"⚠️ Warning: compiled model failed, using eager model: {str(e)}")
+                compiled_model = None
+        if logits is None:
+            logits = model(**inputs).logits
+
+    return torch.sigmoid(logits).cpu().numpy()
+
+
+# Frequent opening messages, tokenized ahead of time at startup
+COMMON_PHRASES = (
+    "hi",
+    "hello",
+    "hey",
+    "I feel sad",
+    "I'm sad",
+    "I'm happy",
+    "I feel happy",
+    "I'm stressed",
+    "I feel anxious",
+    "I'm tired",
+    "I'm angry",
+    "I feel lonely",
+    "I'm okay",
+    "I'm fine",
+    "thank you",
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _tokenize(text: str):
+    """Tokenize a single text, memoizing the resulting tensors"""
+    return tokenizer(
+        text,
+        return_tensors="pt",
+        truncation=True,
+        padding=True,
+        max_length=512
+    )
+
+
+if not USE_MOCK:
+    for _phrase in COMMON_PHRASES:
+        _tokenize(_phrase)
 
 
-def predict_emotions(text: str, threshold=0.3):
+@st.cache_resource
+def get_inference_executor():
+    """Shared worker pool for running BERT inference off the script thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="emosense-bert")
+
+
+def submit_predict_emotions(text: str, threshold=0.3):
+    """
+    Start predict_emotions on the shared worker pool.
+    
+    torch releases the GIL during the forward pass, so other work on the
+    script thread (e.g. the sklearn models) runs concurrently.
+    
+    Returns:
+        concurrent.futures.Future resolving to (predicted_emotions, probabilities)
+    """
+    return get_inference_executor().submit(predict_emotions, text, threshold)
+
+
+def predict_emotions(text: str, threshold=0.3, return_array=False):
     """
     Predict emotions from input text.
     
     Args:
         text (str): Input text to analyze
         threshold (float): Probability threshold for emotion detection (default: 0.3)
+        return_array (bool): Also return the raw probabilities as a numpy array
+            indexed like EMOTIONS (default: False)
     
     Returns:
-        tuple: (predicted_emotions, probabilities)
+        tuple: (predicted_emotions, probabilities), or
+            (predicted_emotions, probabilities, probs_array) if return_array
     """
     if USE_MOCK:
         # Mock predictions for demo
@@ -74,28 +238,135 @@ def predict_emotions(text: str, threshold=0.3):
         prob_dict = {emotion: float(prob) for emotion, prob in zip(EMOTIONS, probs)}
         
         predicted_emotions = [emotion for emotion, prob in prob_dict.items() if prob >= threshold]
+        if return_array:
+            return predicted_emotions, prob_dict, np.asarray(probs, dtype=np.float32)
         return predicted_emotions, prob_dict
     
     # Real model prediction
-    inputs = tokenizer(
-        text,
-        return_tensors="pt",
-        truncation=True,
-        padding=True,
-        max_length=512
-    )
-
-    inputs = {key: val.to(device) for key, val in inputs.items()}
-
-    with torch.no_grad():
-        outputs = model(**inputs)
-        logits = outputs.logits
+    inputs = _tokenize(text.strip())
 
-    probabilities = torch.sigmoid(logits)
-    probs = probabilities[0].cpu().numpy().tolist()
+    probs_array = _forward_probs(inputs)[0]
 
-    prob_dict = {emotion: float(prob) for emotion, prob in zip(EMOTIONS, probs)}
+    prob_dict = {emotion: float(prob) for emotion, prob in zip(EMOTIONS, probs_array.tolist())}
     
     predicted_emotions = [emotion for emotion, prob in prob_dict.items() if prob >= threshold]
 
+    if return_array:
+        return predicted_emotions, prob_dict, probs_array
     return predicted_emotions, prob_dict
+
+
+def predict_dominant_emotion(text: str):
+    """
+    Predict the single highest-probability emotion for a text.
+    
+    Args:
+        text (str): Input text to analyze
+    
+    Returns:
+        tuple: (emotion, probability)
+    """
+    _, _, probs_array = predict_emotions(text, return_array=True)
+    top_idx = int(probs_array.argmax())
+    return EMOTIONS[top_idx], float(probs_array[top_idx])
+
+
+def predict_probs_batch(texts, batch_size=32):
+    """
+    Score a list of texts with batched forward passes, without per-text dicts.
+    
+    Args:
+        texts (list[str]): Input texts to analyze
+        batch_size (int): Number of texts per forward pass (default: 32)
+    
+    Returns:
+        numpy.ndarray: (len(texts), len(EMOTIONS)) probabilities, columns ordered like EMOTIONS
+    """
+    if not texts:
+        return np.empty((0, len(EMOTIONS)), dtype=np.float32)
+    
+    if USE_MOCK:
+        return np.stack([predict_emotions(text, return_array=True)[2] for text in texts])
+    
+    matrices = []
+    for start in range(0, len(texts), batch_size):
+        batch = tokenizer(
+            list(texts[start:start + batch_size]),
+            return_tensors="pt",
+            truncation=True,
+            padding=True,
+            max_length=512
+        )
+        matrices.append(_forward_probs(batch))
+
+    return np.concatenate(matrices)
+
+
+def predict_emotions_batch(texts, threshold=0.3, batch_size=32, return_array=False):
+    """
+    Predict emotions for a list of texts with batched forward passes.
+    
+    Args:
+        texts (list[str]): Input texts to analyze
+        threshold (float): Probability threshold for emotion detection (default: 0.3)
+        batch_size (int): Number of texts per forward pass (default: 32)
+        return_array (bool): Also return the raw probabilities as a
+            (len(texts), len(EMOTIONS)) numpy array (default: False)
+    
+    Returns:
+        list: (predicted_emotions, probabilities) tuples, one per input text, or
+            (results, probs_matrix) if return_array
+    """
+    probs_matrix = predict_probs_batch(texts, batch_size=batch_size)
+    
+    results = []
+    for probs in probs_matrix.tolist():
+        prob_dict = {emotion: float(prob) for emotion, prob in zip(EMOTIONS, probs)}
+        predicted_emotions = [emotion for emotion, prob in prob_dict.items() if prob >= threshold]
+        results.append((predicted_emotions, prob_dict))
+
+    if return_array:
+        return results, probs_matrix
+    return results
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_predict_probs_batch(texts: tuple):
+    """predict_probs_batch memoized on the texts so re-analyzing the same comments skips inference"""
+    return predict_probs_batch(list(texts), batch_size=len(texts))
+
+
+def predict_comment_probs(texts, batch_size=32, on_progress=None):
+    """
+    Score comments in cached chunks of batch_size texts.
+    
+    The threshold is left out of the cache key since probabilities don't
+    depend on it. If a chunk fails, its comments are retried one at a time
+    so only the comments that actually fail are lost.
+    
+    Args:
+        texts (list[str]): Comments to analyze
+        batch_size (int): Number of comments per cached chunk (default: 32)
+        on_progress (callable): Optional callback(done, total) called after each chunk
+    
+    Returns:
+        numpy.ndarray: (len(texts), len(EMOTIONS)) probabilities; rows of
+            comments that could not be scored are NaN
+    """
+    probs_matrix = np.full((len(texts), len(EMOTIONS)), np.nan, dtype=np.float32)
+    
+    for start in range(0, len(texts), batch_size):
+        batch = tuple(texts[start:start + batch_size])
+        try:
+            probs_matrix[start:start + len(batch)] = cached_predict_probs_batch(batch)
+        except Exception:
+            for offset, text in enumerate(batch):
+                try:
+                    probs_matrix[start + offset] = cached_predict_probs_batch((text,))[0]
+                except Exception as e:
+                    print(f"⚠️ Warning: Emotion analysis failed for one comment: {e}")
+        
+        if on_progress is not None:
+            on_progress(start + len(batch), len(texts))
+    
+    return probs_matrix